@@ -1,141 +1,228 @@
 """
-Cache utility functions for API list view cache invalidation.
+Cache utility functions for API list view caching and cache invalidation.
 
-This module provides utilities for invalidating cached responses from
-cache_page decorator, particularly for paginated list views.
+This module provides the cache_list_view decorator used to cache paginated list
+views, and utilities for invalidating those cached responses. It also holds the
+read-through cache of each stock's latest DONE ingestion run.
 
 Cache Key Format:
-    The cache_page decorator generates cache keys in the format:
+    Django's page cache generates cache keys in the format:
     'views.decorators.cache.cache_page.{key_prefix}.GET.{hash1}.{hash2}.en-us.UTC'
-    
+
     Where:
-    - key_prefix: The key_prefix parameter passed to cache_page decorator (e.g., 'api:ticker-list')
+    - key_prefix: '{view_name}:v{version}', e.g. 'api:ticker-list:v3' (see below)
     - hash1: Hash of the request path/parameters
     - hash2: Hash of the query string (includes cursor, filters, etc.)
-    
+
     Each unique combination of path and query parameters (including pagination cursors
     and filters) results in a unique cache key. This means:
     - Different paginated pages (different cursor values) have different cache keys
     - Different filter combinations have different cache keys
     - The same page with the same filters will reuse the same cache key
-    
+
 Cache Invalidation Strategy:
     When a model is created, updated, or deleted, we need to invalidate all cached
-    pages for the affected list views. Since query parameters vary per page, we
-    use pattern matching to find and delete all cache keys matching the path prefix.
-    
-    For Redis backend:
-    - Use SCAN command (via scan_iter) to find all keys matching pattern
-    - Use DELETE command to remove all matching keys
-    - SCAN is preferred over KEYS for production environments (non-blocking)
-    
+    pages for the affected list views. Since query parameters vary per page, the
+    set of keys for a view is open-ended.
+
+    Rather than finding and deleting those keys, every view has a version counter
+    in Redis ('ver:{view_name}') that is part of its cache key prefix. For Redis backend:
+    - On each request, GET the view's version to build the key prefix
+    - On invalidation, INCR the version: pages cached under the previous version
+      are never looked up again and expire through their normal cache timeout
+
+    Signal handlers don't invalidate immediately: schedule_list_view_cache_invalidation()
+    defers the INCR until the surrounding transaction commits, at most once per
+    view per transaction.
+
 Performance Considerations:
-    - SCAN is non-blocking and safe for production use
-    - KEYS command blocks Redis and should be avoided in production
-    - Pattern matching may need to scan many keys, but this is acceptable for
-      infrequent cache invalidation operations (only on model changes)
+    - Invalidation is a single INCR, regardless of how many pages are cached
+    - No SCAN/KEYS sweeps and no bulk deletes blocking the Redis main thread
+    - Each list request costs one extra GET for the version
+    - Superseded pages keep using memory until their timeout (CACHE_MIDDLEWARE_SECONDS)
 """
 
 import logging
+import threading
+import weakref
+from collections.abc import Iterable
 
 from django.core.cache import cache
-from django.urls import reverse
+from django.db import transaction
+from django.middleware.cache import CacheMiddleware
+from django.utils.decorators import decorator_from_middleware_with_args
 
 logger = logging.getLogger(__name__)
 
+# Redis clients by connection pool. RedisCacheClient.get_client() builds a new
+# client around the pool on every call; these are reused instead.
+_redis_clients: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
 
-def invalidate_list_view_cache(view_name: str) -> None:
+
+def _get_redis_client(*, write: bool = False):
     """
-    Invalidate all cached responses for a list view.
+    Return a Redis client for the default cache backend.
     
-    This function invalidates all cache keys for a specific list view endpoint,
-    including all paginated pages and filter combinations. It works by:
-    1. Getting the URL path for the view using reverse()
-    2. Constructing a cache key prefix pattern
-    3. Finding all cache keys matching the pattern
-    4. Deleting all matching keys
+    Resolved through the backend on each call, so cache settings overridden at
+    runtime (e.g. in tests) are honoured, but the client itself is reused for
+    as long as its connection pool exists.
     
-    The cache_page decorator generates cache keys in the format:
-    'views.decorators.cache.cache_page.{key_prefix}.GET.{hash1}.{hash2}.en-us.UTC'
+    Args:
+        write: Whether the client is used for writes (selects the primary server)
+    
+    Returns:
+        The Redis client, or None if the cache backend isn't Redis
+    """
+    cache_backend = cache._cache
+    if not hasattr(cache_backend, 'get_client'):
+        return None
+    if not hasattr(cache_backend, '_get_connection_pool'):
+        # Not Django's RedisCacheClient; let the backend resolve the client
+        return cache_backend.get_client(write=write)
     
-    Where key_prefix is the key_prefix parameter passed to cache_page decorator.
-    Since query parameters (cursor, filters) vary per page, we need to delete
-    all keys matching the key_prefix pattern.
+    pool = cache_backend._get_connection_pool(write)
+    redis_client = _redis_clients.get(pool)
+    if redis_client is None:
+        redis_client = _redis_clients[pool] = cache_backend._client(connection_pool=pool)
+    return redis_client
+
+
+def _get_version_key(view_name: str) -> str:
+    """Return the Redis key holding the cache version counter of a view."""
+    return f'ver:{view_name}'
+
+
+def get_list_view_cache_version(view_name: str) -> int | None:
+    """
+    Return the current cache version of a list view.
     
+    Args:
+        view_name: The name of the view (e.g., 'api:ticker-list')
+    
+    Returns:
+        int | None: The version (0 until the view is first invalidated), or
+            None if it couldn't be read from Redis
+    """
+    redis_client = _get_redis_client()
+    if redis_client is None:
+        return 0
+    
+    version_key = _get_version_key(view_name)
+    try:
+        version = redis_client.get(version_key)
+    except Exception:
+        logger.exception(
+            f"Failed to read cache version for view '{view_name}'",
+            extra={
+                'view_name': view_name,
+            }
+        )
+        return None
+    return int(version or 0)
+
+
+class VersionedCacheMiddleware(CacheMiddleware):
+    """
+    CacheMiddleware whose key prefix includes the view's current cache version.
+    
+    Behaves exactly like the middleware behind Django's cache_page decorator,
+    except that the key_prefix it was configured with (the view name) is
+    extended with the version read at the start of each request. The same
+    prefix is used to store the response, so a page rendered while the view
+    was being invalidated lands under the superseded version and is never served.
+    
+    If the version can't be read, the request bypasses the cache.
+    """
+
+    def __init__(self, get_response, cache_timeout=None, page_timeout=None, **kwargs):
+        # One middleware instance serves every request to the decorated view,
+        # so the per-request prefix is kept per thread.
+        self._request_state = threading.local()
+        super().__init__(get_response, cache_timeout, page_timeout, **kwargs)
+
+    @property
+    def key_prefix(self) -> str:
+        return getattr(self._request_state, 'key_prefix', self.view_name)
+
+    @key_prefix.setter
+    def key_prefix(self, value: str) -> None:
+        self.view_name = value
+
+    def process_request(self, request):
+        version = get_list_view_cache_version(self.view_name)
+        if version is None:
+            request._cache_update_cache = False
+            return None
+        self._request_state.key_prefix = f'{self.view_name}:v{version}'
+        return super().process_request(request)
+
+
+def cache_list_view(timeout, *, key_prefix):
+    """
+    Cache a list view like cache_page, with versioned keys for cheap invalidation.
+
+    Args:
+        timeout: Cache timeout in seconds, or None to use the default
+            cache middleware timeout (CACHE_MIDDLEWARE_SECONDS)
+        key_prefix: Cache key prefix; must be the view name later passed to
+            invalidate_list_view_cache() (e.g., 'api:ticker-list')
+
+    Example:
+        @method_decorator(cache_list_view(None, key_prefix='api:ticker-list'), name='dispatch')
+        class TickerListView(ListAPIView):
+            ...
+    """
+    return decorator_from_middleware_with_args(VersionedCacheMiddleware)(
+        page_timeout=timeout,
+        key_prefix=key_prefix,
+    )
+
+
+def invalidate_list_view_cache(view_name: str) -> None:
+    """
+    Invalidate all cached responses for a list view.
+
+    This function invalidates all cache keys for a specific list view endpoint,
+    including all paginated pages and filter combinations, by incrementing the
+    view's version counter ('ver:{view_name}'). Cached pages carry the version in
+    their key prefix, so none of the existing pages will be looked up again;
+    they expire through their normal cache timeout.
+
     Args:
         view_name: The name of the view to invalidate (e.g., 'api:exchange-list')
-        
+
     Example:
         invalidate_list_view_cache('api:exchange-list')
         invalidate_list_view_cache('api:ticker-list')
-        
+
     Note:
         This function handles Redis backend specifically. For other backends,
         it logs a warning and skips invalidation. Cache invalidation is logged
-        at INFO level with the view name and number of keys deleted.
+        at DEBUG level with the view name and the new version.
     """
     try:
-        
-        # Construct cache key prefix pattern
-        # Django's cache_page creates two types of cache keys:
-        # 1. cache_page format: 'views.decorators.cache.cache_page.{key_prefix}.GET.{hash1}.{hash2}.en-us.UTC'
-        # 2. cache_header format: 'views.decorators.cache.cache_header.{key_prefix}.{hash}.en-us.UTC'
-        # Where key_prefix is the key_prefix parameter passed to cache_page decorator (e.g., 'api:ticker-list')
-        # Redis pattern uses '*' to match any characters
-        
-        # Get cache backend
-        cache_backend = cache._cache
-        
-        # Check if we're using Redis backend
-        if not hasattr(cache_backend, 'get_client'):
+        # Get Redis client, if we're using Redis backend
+        redis_client = _get_redis_client(write=True)
+        if redis_client is None:
             logger.warning(
-                f"Cache backend does not support pattern-based invalidation for view '{view_name}'. "
-                f"Backend type: {type(cache_backend).__name__}"
+                f"Cache backend does not support versioned invalidation for view '{view_name}'. "
+                f"Backend type: {type(cache._cache).__name__}"
             )
             return
-        
-        # Get Redis client
-        redis_client = cache_backend.get_client()
-        
-        # Use SCAN to find all keys matching the pattern (non-blocking)
-        # Django's cache_page creates two types of cache keys:
-        # 1. cache_page keys: views.decorators.cache.cache_page.{key_prefix}.GET.*
-        # 2. cache_header keys: views.decorators.cache.cache_header.{key_prefix}.*
-        keys_to_delete = []
-        
-        # Pattern for cache_page keys (use * prefix to match version prefix like :1:)
-        cache_page_pattern = f'*views.decorators.cache.cache_page.{view_name}.GET.*'
-        # Pattern for cache_header keys (use * prefix to match version prefix like :1:)
-        cache_header_pattern = f'*views.decorators.cache.cache_header.{view_name}.*'
-        
-        # SCAN iterates through all keys matching both patterns
-        for pattern_to_use in [cache_page_pattern, cache_header_pattern]:
-            for key in redis_client.scan_iter(match=pattern_to_use):
-                # Decode bytes to string if needed
-                if isinstance(key, bytes):
-                    key = key.decode('utf-8')
-                keys_to_delete.append(key)
-        
-        # Delete all matching keys
-        if keys_to_delete:
-            deleted_count = redis_client.delete(*keys_to_delete)
-            logger.debug(
-                f"Invalidated cache for view '{view_name}': deleted {deleted_count} cache key(s)",
-                extra={
-                    'view_name': view_name,
-                    'keys_deleted': deleted_count,
-                    'patterns': [cache_page_pattern, cache_header_pattern]
-                }
-            )
-        else:
-            logger.debug(
-                f"No cache keys found to invalidate for view '{view_name}'",
-                extra={
-                    'view_name': view_name,
-                    'patterns': [cache_page_pattern, cache_header_pattern]
-                }
-            )
-            
+
+        version_key = _get_version_key(view_name)
+
+        version = redis_client.incr(version_key)
+
+        logger.debug(
+            f"Invalidated cache for view '{view_name}': now at version {version}",
+            extra={
+                'view_name': view_name,
+                'version': version,
+                'version_key': version_key,
+            }
+        )
+
     except Exception:
         logger.exception(
             f"Failed to invalidate cache for view '{view_name}'",
@@ -144,3 +231,138 @@ def invalidate_list_view_cache(view_name: str) -> None:
             }
         )
 
+
+def schedule_list_view_cache_invalidation(view_name: str, using: str | None = None) -> None:
+    """
+    Invalidate a list view cache once the current transaction commits.
+    
+    The invalidation runs from a transaction.on_commit() callback, so rolled
+    back changes never invalidate anything and pages rendered before the commit
+    can't be cached under the new version. Repeated calls for the same view
+    within one transaction (e.g. a bulk import saving thousands of stocks)
+    invalidate it once. Outside of a transaction the cache is invalidated
+    immediately.
+    
+    Args:
+        view_name: The name of the view to invalidate (e.g., 'api:ticker-list')
+        using: Database alias of the transaction to wait for (default database if None)
+    """
+    connection = transaction.get_connection(using)
+    
+    # Django swaps in a new run_on_commit list whenever the transaction commits
+    # or rolls back, so the views scheduled so far are tracked against the list
+    # they were registered in and are forgotten together with it.
+    pending_callbacks, scheduled_views = getattr(
+        connection, '_scheduled_list_view_invalidations', (None, None)
+    )
+    if pending_callbacks is not connection.run_on_commit:
+        scheduled_views = set()
+        connection._scheduled_list_view_invalidations = (connection.run_on_commit, scheduled_views)
+    
+    if view_name in scheduled_views:
+        return
+    if connection.in_atomic_block:
+        scheduled_views.add(view_name)
+    transaction.on_commit(lambda: invalidate_list_view_cache(view_name), using=using)
+
+
+# Latest DONE run per stock (StockIngestionRunManager.get_latest_done_run).
+# A stock gets a new DONE run at most once per ingestion cycle, so entries are
+# long-lived and dropped explicitly whenever one of its runs reaches DONE.
+LATEST_DONE_RUN_CACHE_TIMEOUT = 60 * 60
+
+
+def get_latest_done_run_cache_key(stock_id) -> str:
+    """Return the cache key holding the latest DONE run of a stock."""
+    return f'latest_done_run:{stock_id}'
+
+
+def get_cached_latest_done_run(stock_id) -> dict | None:
+    """
+    Return the cached field values of a stock's latest DONE run.
+    
+    Args:
+        stock_id: UUID of the stock
+    
+    Returns:
+        dict | None: Field values by attribute name, or None on a cache miss
+            or if the cache couldn't be read
+    """
+    try:
+        return cache.get(get_latest_done_run_cache_key(stock_id))
+    except Exception:
+        logger.warning(
+            f"Failed to read latest DONE run cache for stock '{stock_id}'",
+            exc_info=True,
+            extra={
+                'stock_id': str(stock_id),
+            }
+        )
+        return None
+
+
+def set_cached_latest_done_run(stock_id, values: dict) -> None:
+    """
+    Cache the field values of a stock's latest DONE run.
+    
+    Args:
+        stock_id: UUID of the stock
+        values: Field values by attribute name
+    """
+    try:
+        cache.set(get_latest_done_run_cache_key(stock_id), values, LATEST_DONE_RUN_CACHE_TIMEOUT)
+    except Exception:
+        logger.warning(
+            f"Failed to cache latest DONE run for stock '{stock_id}'",
+            exc_info=True,
+            extra={
+                'stock_id': str(stock_id),
+            }
+        )
+
+
+def _delete_cached_latest_done_runs(stock_ids: list) -> None:
+    """Drop the cached latest DONE runs of the given stocks."""
+    try:
+        cache.delete_many([get_latest_done_run_cache_key(stock_id) for stock_id in stock_ids])
+    except Exception:
+        logger.exception(
+            f"Failed to invalidate latest DONE run cache for {len(stock_ids)} stocks",
+            extra={
+                'stock_count': len(stock_ids),
+            }
+        )
+
+
+def schedule_latest_done_run_cache_invalidation(stock_ids: Iterable, using: str | None = None) -> None:
+    """
+    Drop the cached latest DONE runs of stocks once the current transaction commits.
+    
+    Deleting on commit rather than immediately keeps a concurrent read from
+    caching the previous DONE run again before the new one is visible.
+    Stocks scheduled within one transaction (e.g. every run a bulk update
+    moves to DONE) are dropped together with a single delete_many().
+    Outside of a transaction the entries are dropped immediately.
+    
+    Args:
+        stock_ids: UUIDs of the stocks whose latest DONE run changed
+        using: Database alias of the transaction to wait for (default database if None)
+    """
+    stock_ids = set(stock_ids)
+    if not stock_ids:
+        return
+    
+    connection = transaction.get_connection(using)
+    
+    # Tracked against the run_on_commit list like the list view invalidations
+    # above: the stocks are added to the callback already registered in this
+    # transaction, if any.
+    pending_callbacks, scheduled_stock_ids = getattr(
+        connection, '_scheduled_latest_done_run_invalidations', (None, None)
+    )
+    if connection.in_atomic_block and pending_callbacks is connection.run_on_commit:
+        scheduled_stock_ids.update(stock_ids)
+        return
+    if connection.in_atomic_block:
+        connection._scheduled_latest_done_run_invalidations = (connection.run_on_commit, stock_ids)
+    transaction.on_commit(lambda: _delete_cached_latest_done_runs(list(stock_ids)), using=using)
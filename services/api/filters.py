@@ -4,11 +4,92 @@ Django filters for Stock, StockIngestionRun, BulkQueueRun, and Exchange models.
 This module provides FilterSet classes for filtering API list views
 using django-filter. Filters support various lookup expressions including
 exact matches, contains searches, date ranges, and boolean filters.
+
+It also provides QueryParamFilterBackend, the filter backend used by the
+list views.
 """
 
+import functools
+
+from django.db.models import Q
 from django_filters import rest_framework as filters
+from django_filters import utils
+
+from api.models import (
+    INGESTION_STATE_CHOICES,
+    BulkQueueRun,
+    Exchange,
+    Sector,
+    Stock,
+    StockIngestionRun,
+)
+
+
+class QueryParamFilterBackend(filters.DjangoFilterBackend):
+    """
+    DjangoFilterBackend that only builds the filters a request asks for.
+    
+    Building a FilterSet constructs its form and deep-copies every declared
+    filter, most of which a given request never uses:
+    - When none of the request's query parameters name a filter of the view's
+      FilterSet (a plain page fetch, or only a cursor), the FilterSet is skipped
+      and the queryset is returned untouched.
+    - Otherwise the request is filtered with a subclass of the FilterSet whose
+      base_filters only contain the requested filters. Subclasses are built
+      once per combination of filter names and reused.
+    
+    get_filterset() is left alone, so the browsable API's filter form (to_html)
+    still shows every filter of the FilterSet.
+    
+    Note: filters are matched by name, so this assumes no filter uses a
+    multi-value widget with suffixed parameter names (e.g. RangeFilter).
+    """
+    
+    def filter_queryset(self, request, queryset, view):
+        filterset_class = self.get_filterset_class(view, queryset)
+        if filterset_class is None:
+            return queryset
+        
+        requested = frozenset(request.query_params.keys() & filterset_class.base_filters.keys())
+        if not requested:
+            return queryset
+        
+        filterset_class = get_trimmed_filterset_class(filterset_class, requested)
+        filterset = filterset_class(**self.get_filterset_kwargs(request, queryset, view))
+        if not filterset.is_valid() and self.raise_exception:
+            raise utils.translate_validation(filterset.errors)
+        return filterset.qs
 
-from api.models import BulkQueueRun, Exchange, Sector, Stock, StockIngestionRun, IngestionState
+
+@functools.lru_cache(maxsize=256)
+def get_trimmed_filterset_class(filterset_class: type, filter_names: frozenset[str]) -> type:
+    """
+    Return a subclass of filterset_class declaring only the named filters.
+    
+    Cached per combination of filters. The combinations are chosen by clients
+    (up to 2^N per FilterSet), so only the most recently used are kept.
+    
+    Args:
+        filterset_class: The FilterSet class to trim
+        filter_names: Names of the filters to keep (must be in base_filters)
+        
+    Returns:
+        The subclass for this combination of filters
+    """
+    trimmed_class = type(filterset_class.__name__, (filterset_class,), {
+        '__module__': filterset_class.__module__,
+        '__doc__': filterset_class.__doc__,
+    })
+    # Set after class creation: the FilterSet metaclass recomputes base_filters
+    trimmed_class.base_filters = {
+        name: filter_ for name, filter_ in filterset_class.base_filters.items()
+        if name in filter_names
+    }
+    return trimmed_class
+
+
+class ChoiceInFilter(filters.BaseInFilter, filters.ChoiceFilter):
+    """Comma-separated list of choices, validated against the filter's choices."""
 
 
 class ExchangeFilter(filters.FilterSet):
@@ -98,6 +179,29 @@ class StockFilter(filters.FilterSet):
         }
 
 
+class StockLatestRunFilter(StockFilter):
+    """
+    FilterSet for stocks listed with their latest ingestion run.
+    
+    Provides the StockFilter filters, plus:
+    - latest_run_state: Filter by the state of the stock's latest run
+    - latest_run_state__in: Filter by any of several latest run states (comma-separated)
+    
+    Both read the denormalized Stock.latest_run_state column (indexed), not
+    the runs table.
+    
+    Example usage:
+        ?latest_run_state=FAILED               # Stocks whose latest run failed
+        ?latest_run_state__in=FETCHING,FETCHED # Stocks whose latest run is in either state
+        ?latest_run_state=DONE&country=US      # Combined with the stock filters
+    """
+    latest_run_state = filters.ChoiceFilter(field_name='latest_run_state', choices=INGESTION_STATE_CHOICES)
+    latest_run_state__in = ChoiceInFilter(field_name='latest_run_state', choices=INGESTION_STATE_CHOICES)
+
+    class Meta(StockFilter.Meta):
+        pass
+
+
 class StockIngestionRunFilter(filters.FilterSet):
     """
     FilterSet for StockIngestionRun model.
@@ -106,6 +210,7 @@ class StockIngestionRunFilter(filters.FilterSet):
     - run_id: Filter by ingestion run UUID (exact match)
     - ticker: Filter by stock ticker (exact or contains)
     - state: Filter by ingestion state
+    - state__in: Filter by any of several ingestion states (comma-separated)
     - requested_by: Filter by requester identifier
     - created_after: Filter runs created after a date
     - created_before: Filter runs created before a date
@@ -118,6 +223,7 @@ class StockIngestionRunFilter(filters.FilterSet):
         ?ticker=AAPL                           # Runs for AAPL
         ?ticker__icontains=app                 # Runs for tickers containing 'app'
         ?state=FAILED                          # Failed runs only
+        ?state__in=FETCHING,FETCHED            # Runs in either state
         ?requested_by=user@example.com         # Runs requested by specific user
         ?created_after=2025-01-01              # Runs created after Jan 1, 2025
         ?created_before=2025-12-31             # Runs created before Dec 31, 2025
@@ -130,54 +236,63 @@ class StockIngestionRunFilter(filters.FilterSet):
     run_id = filters.UUIDFilter(field_name='id', lookup_expr='exact')
     ticker = filters.CharFilter(field_name='stock__ticker', lookup_expr='iexact')
     ticker__icontains = filters.CharFilter(field_name='stock__ticker', lookup_expr='icontains')
-    state = filters.ChoiceFilter(field_name='state', choices=IngestionState.choices)
+    state = filters.ChoiceFilter(field_name='state', choices=INGESTION_STATE_CHOICES)
+    state__in = ChoiceInFilter(field_name='state', choices=INGESTION_STATE_CHOICES)
     requested_by = filters.CharFilter(field_name='requested_by', lookup_expr='iexact')
     requested_by__icontains = filters.CharFilter(field_name='requested_by', lookup_expr='icontains')
     created_after = filters.DateTimeFilter(field_name='created_at', lookup_expr='gte')
     created_before = filters.DateTimeFilter(field_name='created_at', lookup_expr='lte')
-    is_terminal = filters.BooleanFilter(method='filter_is_terminal')
-    is_in_progress = filters.BooleanFilter(method='filter_is_in_progress')
+    is_terminal = filters.BooleanFilter(field_name='terminal')
+    is_in_progress = filters.BooleanFilter(field_name='terminal', exclude=True)
     bulk_queue_run = filters.UUIDFilter(field_name='bulk_queue_run', lookup_expr='exact')
     
+    # Filters on the run state, combined into a single condition by filter_queryset()
+    state_filter_names = ('state', 'state__in', 'is_terminal', 'is_in_progress')
+    
     class Meta:
         model = StockIngestionRun
         fields = []
     
-    def filter_is_terminal(self, queryset, name, value):
+    def filter_queryset(self, queryset):
         """
-        Filter runs by terminal state.
+        Filter the queryset with the cleaned form data.
         
-        Args:
-            queryset: The base queryset
-            name: The filter field name (unused)
-            value: Boolean - True for terminal, False for non-terminal
-            
-        Returns:
-            Filtered queryset
-        """
-        terminal_states = [IngestionState.DONE, IngestionState.FAILED]
-        if value:
-            return queryset.filter(state__in=terminal_states)
-        else:
-            return queryset.exclude(state__in=terminal_states)
-    
-    def filter_is_in_progress(self, queryset, name, value):
-        """
-        Filter runs by in-progress state.
+        state, state__in, is_terminal and is_in_progress all constrain the run
+        state, so rather than chaining a filter() per parameter they are merged
+        into one Q() and applied once. is_terminal and is_in_progress test the
+        generated terminal column, so queries for runs in progress can use the
+        partial index on active runs. The other filters are applied as usual.
         
         Args:
             queryset: The base queryset
-            name: The filter field name (unused)
-            value: Boolean - True for in-progress, False for terminal
             
         Returns:
             Filtered queryset
         """
-        terminal_states = [IngestionState.DONE, IngestionState.FAILED]
-        if value:
-            return queryset.exclude(state__in=terminal_states)
-        else:
-            return queryset.filter(state__in=terminal_states)
+        cleaned_data = self.form.cleaned_data
+        state_q = Q()
+        
+        if cleaned_data.get('state'):
+            state_q &= Q(state=cleaned_data['state'])
+        
+        if cleaned_data.get('state__in'):
+            state_q &= Q(state__in=cleaned_data['state__in'])
+        
+        is_terminal = cleaned_data.get('is_terminal')
+        if is_terminal is not None:
+            state_q &= Q(terminal=is_terminal)
+        
+        is_in_progress = cleaned_data.get('is_in_progress')
+        if is_in_progress is not None:
+            state_q &= Q(terminal=not is_in_progress)
+        
+        for name, value in cleaned_data.items():
+            if name not in self.state_filter_names:
+                queryset = self.filters[name].filter(queryset, value)
+        
+        if state_q:
+            queryset = queryset.filter(state_q)
+        return queryset
 
 
 class BulkQueueRunFilter(filters.FilterSet):
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.9 on 2026-10-17 06:57
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0004_sector_alter_stock_sector'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='stockingestionrun',
+            index=models.Index(condition=models.Q(('state__in', ['QUEUED_FOR_FETCH', 'FETCHING', 'FETCHED', 'QUEUED_FOR_DELTA', 'DELTA_RUNNING', 'DELTA_FINISHED'])), fields=['state'], name='idx_run_state_in_progress'),
+        ),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 5.2.9 on 2026-10-17 06:58
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0005_stockingestionrun_idx_run_state_in_progress'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='exchange',
+            index=models.Index(django.db.models.functions.text.Upper('name'), name='idx_exchange_name_upper'),
+        ),
+        migrations.AddIndex(
+            model_name='sector',
+            index=models.Index(django.db.models.functions.text.Upper('name'), name='idx_sector_name_upper'),
+        ),
+        migrations.AddIndex(
+            model_name='stock',
+            index=models.Index(django.db.models.functions.text.Upper('ticker'), name='idx_stock_ticker_upper'),
+        ),
+        migrations.AddIndex(
+            model_name='stock',
+            index=models.Index(django.db.models.functions.text.Upper('country'), name='idx_stock_country_upper'),
+        ),
+    ]
@@ -0,0 +1,65 @@
+"""
+Trigram indexes backing the icontains filters.
+
+On Postgres, icontains compiles to UPPER("col"::text) LIKE UPPER('%...%'),
+which no btree index can serve. A GIN index over the same expression with the
+gin_trgm_ops operator class (from the pg_trgm extension) can, for search
+terms of three or more characters.
+
+pg_trgm ships with the standard Postgres distribution (including the
+postgres image used by docker-compose) but may be missing from minimal or
+managed installations, in which case the indexes are skipped and icontains
+filters keep working without them.
+"""
+
+import logging
+
+from django.db import migrations
+
+logger = logging.getLogger(__name__)
+
+# (index name, table, column) for every column filtered with icontains
+TRIGRAM_INDEXES = [
+    ('idx_exchange_name_trgm', 'exchanges', 'name'),
+    ('idx_sector_name_trgm', 'sectors', 'name'),
+    ('idx_stock_ticker_trgm', 'stocks', 'ticker'),
+    ('idx_run_requested_by_trgm', 'stock_ingestion_runs', 'requested_by'),
+    ('idx_bulk_queue_requested_by_trgm', 'bulk_queue_runs', 'requested_by'),
+]
+
+
+def create_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute("SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'")
+        if cursor.fetchone() is None:
+            logger.warning("pg_trgm extension is not available, skipping trigram indexes")
+            return
+
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    for index_name, table, column in TRIGRAM_INDEXES:
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS "{index_name}" ON "{table}" '
+            f'USING gin (UPPER("{column}"::text) gin_trgm_ops)'
+        )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+
+    for index_name, _table, _column in TRIGRAM_INDEXES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS "{index_name}"')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0006_case_insensitive_lookup_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
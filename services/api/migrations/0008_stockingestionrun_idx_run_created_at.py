@@ -0,0 +1,17 @@
+# Generated by Django 5.2.9 on 2026-10-17 07:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0007_trigram_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='stockingestionrun',
+            index=models.Index(fields=['-created_at'], name='idx_run_created_at'),
+        ),
+    ]
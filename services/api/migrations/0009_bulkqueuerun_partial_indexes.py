@@ -0,0 +1,21 @@
+# Generated by Django 5.2.9 on 2026-10-17 07:06
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0008_stockingestionrun_idx_run_created_at'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='bulkqueuerun',
+            index=models.Index(condition=models.Q(('completed_at__isnull', True)), fields=['-created_at'], name='idx_bulk_queue_incomplete'),
+        ),
+        migrations.AddIndex(
+            model_name='bulkqueuerun',
+            index=models.Index(condition=models.Q(('error_count__gt', 0)), fields=['-created_at'], name='idx_bulk_queue_has_errors'),
+        ),
+    ]
@@ -0,0 +1,55 @@
+"""
+Normalize stock tickers and exchange names in the database.
+
+Stock.save() and Exchange.save() strip and uppercase these columns, but
+bulk_create(), bulk_update(), QuerySet.update() and raw SQL bypass save().
+BEFORE INSERT/UPDATE triggers apply the same normalization to every write,
+so bulk paths don't need to go through save() to keep the columns canonical.
+"""
+
+from django.db import migrations
+
+# Characters str.strip() removes that Postgres' btrim() doesn't by default
+WHITESPACE = "' ' || chr(9) || chr(10) || chr(11) || chr(12) || chr(13)"
+
+CREATE_TRIGGERS = f"""
+CREATE OR REPLACE FUNCTION stocks_normalize_ticker() RETURNS trigger AS $$
+BEGIN
+    NEW.ticker := upper(btrim(NEW.ticker, {WHITESPACE}));
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER stocks_normalize_ticker
+    BEFORE INSERT OR UPDATE OF ticker ON stocks
+    FOR EACH ROW EXECUTE FUNCTION stocks_normalize_ticker();
+
+CREATE OR REPLACE FUNCTION exchanges_normalize_name() RETURNS trigger AS $$
+BEGIN
+    NEW.name := upper(btrim(NEW.name, {WHITESPACE}));
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER exchanges_normalize_name
+    BEFORE INSERT OR UPDATE OF name ON exchanges
+    FOR EACH ROW EXECUTE FUNCTION exchanges_normalize_name();
+"""
+
+DROP_TRIGGERS = """
+DROP TRIGGER IF EXISTS stocks_normalize_ticker ON stocks;
+DROP FUNCTION IF EXISTS stocks_normalize_ticker();
+DROP TRIGGER IF EXISTS exchanges_normalize_name ON exchanges;
+DROP FUNCTION IF EXISTS exchanges_normalize_name();
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0009_bulkqueuerun_partial_indexes'),
+    ]
+
+    operations = [
+        migrations.RunSQL(CREATE_TRIGGERS, DROP_TRIGGERS),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.9 on 2026-10-17 07:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0010_normalize_identifiers_trigger'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='stockingestionrun',
+            name='idx_run_state_in_progress',
+        ),
+        migrations.AddIndex(
+            model_name='stockingestionrun',
+            index=models.Index(condition=models.Q(('state__in', ['QUEUED_FOR_FETCH', 'FETCHING', 'FETCHED', 'QUEUED_FOR_DELTA', 'DELTA_RUNNING', 'DELTA_FINISHED'])), fields=['-created_at'], name='idx_active_runs'),
+        ),
+    ]
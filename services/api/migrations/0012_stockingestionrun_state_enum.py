@@ -0,0 +1,67 @@
+# Generated by Django 5.2.9 on 2026-10-17 07:14
+
+import api.models
+from django.db import migrations, models
+
+ACTIVE_STATES = ['QUEUED_FOR_FETCH', 'FETCHING', 'FETCHED', 'QUEUED_FOR_DELTA', 'DELTA_RUNNING', 'DELTA_FINISHED']
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0011_stockingestionrun_idx_active_runs'),
+    ]
+
+    operations = [
+        # Partial indexes on state are rebuilt around the type change: their
+        # predicates compare state as text, which queries on the enum column
+        # would no longer match.
+        migrations.RemoveConstraint(
+            model_name='stockingestionrun',
+            name='unique_active_run_per_stock',
+        ),
+        migrations.RemoveIndex(
+            model_name='stockingestionrun',
+            name='idx_active_runs',
+        ),
+        migrations.RunSQL(
+            "CREATE TYPE ingestion_state AS ENUM ("
+            "'QUEUED_FOR_FETCH', 'FETCHING', 'FETCHED', 'QUEUED_FOR_DELTA', "
+            "'DELTA_RUNNING', 'DELTA_FINISHED', 'DONE', 'FAILED')",
+            "DROP TYPE ingestion_state",
+        ),
+        # AlterField doesn't cast existing values (USING) and would leave the
+        # varchar_pattern_ops index Django adds for indexed CharFields behind.
+        migrations.SeparateDatabaseAndState(
+            database_operations=[
+                migrations.RunSQL(
+                    [
+                        'DROP INDEX IF EXISTS stock_ingestion_runs_state_d1eee818_like',
+                        'ALTER TABLE stock_ingestion_runs ALTER COLUMN state '
+                        'TYPE ingestion_state USING state::ingestion_state',
+                    ],
+                    [
+                        'ALTER TABLE stock_ingestion_runs ALTER COLUMN state '
+                        'TYPE varchar(20) USING state::text',
+                        'CREATE INDEX stock_ingestion_runs_state_d1eee818_like '
+                        'ON stock_ingestion_runs (state varchar_pattern_ops)',
+                    ],
+                ),
+            ],
+            state_operations=[
+                migrations.AlterField(
+                    model_name='stockingestionrun',
+                    name='state',
+                    field=api.models.IngestionStateField(choices=[('QUEUED_FOR_FETCH', 'Queued for Fetch'), ('FETCHING', 'Fetching'), ('FETCHED', 'Fetched'), ('QUEUED_FOR_DELTA', 'Queued for Delta Lake'), ('DELTA_RUNNING', 'Delta Lake Running'), ('DELTA_FINISHED', 'Delta Lake Finished'), ('DONE', 'Done'), ('FAILED', 'Failed')], db_index=True, default='QUEUED_FOR_FETCH', max_length=20),
+                ),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='stockingestionrun',
+            index=models.Index(condition=models.Q(('state__in', ACTIVE_STATES)), fields=['-created_at'], name='idx_active_runs'),
+        ),
+        migrations.AddConstraint(
+            model_name='stockingestionrun',
+            constraint=models.UniqueConstraint(condition=models.Q(('state__in', ACTIVE_STATES)), fields=('stock',), name='unique_active_run_per_stock'),
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 5.2.9 on 2026-10-17 07:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0012_stockingestionrun_state_enum'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='stockingestionrun',
+            name='idx_active_runs',
+        ),
+        migrations.AddField(
+            model_name='stockingestionrun',
+            name='terminal',
+            field=models.GeneratedField(db_persist=True, expression=models.Q(('state__in', ['DONE', 'FAILED'])), output_field=models.BooleanField()),
+        ),
+        migrations.AddIndex(
+            model_name='stockingestionrun',
+            index=models.Index(condition=models.Q(('terminal', False)), fields=['-created_at'], name='idx_active_runs'),
+        ),
+    ]
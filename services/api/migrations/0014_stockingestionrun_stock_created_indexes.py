@@ -0,0 +1,25 @@
+# Generated by Django 5.2.9 on 2026-10-17 07:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0013_stockingestionrun_terminal'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='stockingestionrun',
+            name='idx_run_stock_created_at',
+        ),
+        migrations.AddIndex(
+            model_name='stockingestionrun',
+            index=models.Index(fields=['stock', '-created_at'], include=('state', 'id'), name='idx_run_stock_created_cover'),
+        ),
+        migrations.AddIndex(
+            model_name='stockingestionrun',
+            index=models.Index(condition=models.Q(('state', 'DONE')), fields=['stock', '-created_at'], name='idx_run_stock_done_created'),
+        ),
+    ]
@@ -0,0 +1,102 @@
+"""
+Denormalize the state of each stock's latest ingestion run onto stocks.
+
+Triggers on stock_ingestion_runs keep stocks.latest_run_state and
+stocks.latest_run_at in line with the stock's latest run by created_at,
+whichever path writes the runs (save(), update(), bulk_create(), raw SQL).
+Deleting the latest run falls back to the previous one.
+
+A BEFORE UPDATE trigger on stocks discards changes to both columns unless
+they come from the triggers above (pg_trigger_depth() > 1), so saving a
+Stock loaded before its latest run changed doesn't overwrite them.
+"""
+
+import api.models
+from django.db import migrations, models
+
+BACKFILL = """
+UPDATE stocks
+SET latest_run_state = latest.state, latest_run_at = latest.created_at
+FROM (
+    SELECT DISTINCT ON (stock_id) stock_id, state, created_at
+    FROM stock_ingestion_runs
+    ORDER BY stock_id, created_at DESC
+) AS latest
+WHERE stocks.id = latest.stock_id;
+"""
+
+CREATE_TRIGGERS = """
+CREATE OR REPLACE FUNCTION stocks_sync_latest_run() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        UPDATE stocks
+        SET (latest_run_state, latest_run_at) = (
+            SELECT state, created_at
+            FROM stock_ingestion_runs
+            WHERE stock_id = OLD.stock_id
+            ORDER BY created_at DESC
+            LIMIT 1
+        )
+        WHERE id = OLD.stock_id AND latest_run_at <= OLD.created_at;
+        RETURN OLD;
+    END IF;
+
+    UPDATE stocks
+    SET latest_run_state = NEW.state, latest_run_at = NEW.created_at
+    WHERE id = NEW.stock_id
+        AND (latest_run_at IS NULL OR latest_run_at <= NEW.created_at)
+        AND (latest_run_state IS DISTINCT FROM NEW.state
+             OR latest_run_at IS DISTINCT FROM NEW.created_at);
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER stocks_sync_latest_run
+    AFTER INSERT OR UPDATE OF state, created_at OR DELETE ON stock_ingestion_runs
+    FOR EACH ROW EXECUTE FUNCTION stocks_sync_latest_run();
+
+CREATE OR REPLACE FUNCTION stocks_protect_latest_run() RETURNS trigger AS $$
+BEGIN
+    IF pg_trigger_depth() = 1 THEN
+        NEW.latest_run_state := OLD.latest_run_state;
+        NEW.latest_run_at := OLD.latest_run_at;
+    END IF;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER stocks_protect_latest_run
+    BEFORE UPDATE OF latest_run_state, latest_run_at ON stocks
+    FOR EACH ROW EXECUTE FUNCTION stocks_protect_latest_run();
+"""
+
+DROP_TRIGGERS = """
+DROP TRIGGER IF EXISTS stocks_protect_latest_run ON stocks;
+DROP FUNCTION IF EXISTS stocks_protect_latest_run();
+DROP TRIGGER IF EXISTS stocks_sync_latest_run ON stock_ingestion_runs;
+DROP FUNCTION IF EXISTS stocks_sync_latest_run();
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0014_stockingestionrun_stock_created_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='stock',
+            name='latest_run_at',
+            field=models.DateTimeField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='stock',
+            name='latest_run_state',
+            field=api.models.IngestionStateField(blank=True, choices=[('QUEUED_FOR_FETCH', 'Queued for Fetch'), ('FETCHING', 'Fetching'), ('FETCHED', 'Fetched'), ('QUEUED_FOR_DELTA', 'Queued for Delta Lake'), ('DELTA_RUNNING', 'Delta Lake Running'), ('DELTA_FINISHED', 'Delta Lake Finished'), ('DONE', 'Done'), ('FAILED', 'Failed')], db_index=True, editable=False, max_length=20, null=True),
+        ),
+        # Backfilled before the stocks trigger exists, as it would discard
+        # this direct update
+        migrations.RunSQL(BACKFILL, migrations.RunSQL.noop),
+        migrations.RunSQL(CREATE_TRIGGERS, DROP_TRIGGERS),
+    ]
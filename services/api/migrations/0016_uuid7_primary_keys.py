@@ -0,0 +1,24 @@
+# Generated by Django 5.2.9 on 2026-10-17 07:40
+
+import api.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0015_stock_latest_run'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='bulkqueuerun',
+            name='id',
+            field=models.UUIDField(default=api.models.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='stockingestionrun',
+            name='id',
+            field=models.UUIDField(default=api.models.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+    ]
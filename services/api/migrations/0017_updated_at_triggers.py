@@ -0,0 +1,55 @@
+"""
+Maintain updated_at in the database for writes that bypass save().
+
+auto_now sets updated_at in Model.save(), but QuerySet.update(), bulk
+updates and raw SQL leave it untouched. A BEFORE UPDATE trigger on each
+table with an updated_at column sets it to the current time whenever an
+UPDATE doesn't change it itself, so save() keeps the value it put on the
+instance and bulk updates no longer need to pass updated_at explicitly.
+
+Updates issued by other triggers (pg_trigger_depth() > 1), such as the
+latest run state kept on stocks, are bookkeeping and leave it alone.
+"""
+
+from django.db import migrations
+
+TABLES = ['exchanges', 'sectors', 'stocks', 'stock_ingestion_runs']
+
+CREATE_FUNCTION = """
+CREATE OR REPLACE FUNCTION set_updated_at() RETURNS trigger AS $$
+BEGIN
+    IF pg_trigger_depth() = 1 AND NEW.updated_at IS NOT DISTINCT FROM OLD.updated_at THEN
+        NEW.updated_at := clock_timestamp();
+    END IF;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+DROP_FUNCTION = "DROP FUNCTION IF EXISTS set_updated_at();"
+
+
+def create_trigger(table):
+    return (
+        f"CREATE TRIGGER {table}_set_updated_at BEFORE UPDATE ON {table} "
+        f"FOR EACH ROW EXECUTE FUNCTION set_updated_at();"
+    )
+
+
+def drop_trigger(table):
+    return f"DROP TRIGGER IF EXISTS {table}_set_updated_at ON {table};"
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0016_uuid7_primary_keys'),
+    ]
+
+    operations = [
+        migrations.RunSQL(CREATE_FUNCTION, DROP_FUNCTION),
+        *(
+            migrations.RunSQL(create_trigger(table), drop_trigger(table))
+            for table in TABLES
+        ),
+    ]
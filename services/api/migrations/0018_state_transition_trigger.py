@@ -0,0 +1,70 @@
+"""
+Reject invalid ingestion run state transitions in the database.
+
+StockIngestionService.update_run_state() validates transitions against
+VALID_TRANSITIONS, but QuerySet.update(), bulk updates and raw SQL don't go
+through it. A BEFORE UPDATE trigger applies the same rules to every write
+that changes a run's state, raising a check_violation (IntegrityError in
+Django) for any other transition.
+
+Mirrors VALID_TRANSITIONS in api/services/stock_ingestion_service.py; a
+change to the state machine needs a migration replacing the function.
+"""
+
+from django.db import migrations
+
+VALID_TRANSITIONS = [
+    ('QUEUED_FOR_FETCH', 'FETCHING'),
+    ('FETCHING', 'FETCHED'),
+    ('FETCHED', 'QUEUED_FOR_DELTA'),
+    ('QUEUED_FOR_DELTA', 'DELTA_RUNNING'),
+    ('DELTA_RUNNING', 'DELTA_FINISHED'),
+    ('DELTA_FINISHED', 'DONE'),
+    # Every active state may fail
+    ('QUEUED_FOR_FETCH', 'FAILED'),
+    ('FETCHING', 'FAILED'),
+    ('FETCHED', 'FAILED'),
+    ('QUEUED_FOR_DELTA', 'FAILED'),
+    ('DELTA_RUNNING', 'FAILED'),
+    ('DELTA_FINISHED', 'FAILED'),
+]
+
+TRANSITIONS_SQL = ',\n            '.join(
+    f"('{from_state}', '{to_state}')" for from_state, to_state in VALID_TRANSITIONS
+)
+
+CREATE_TRIGGER = f"""
+CREATE OR REPLACE FUNCTION stock_ingestion_runs_check_state_transition() RETURNS trigger AS $$
+BEGIN
+    IF (OLD.state, NEW.state) NOT IN (
+            {TRANSITIONS_SQL}
+    ) THEN
+        RAISE EXCEPTION 'Invalid state transition for run %: % -> %', OLD.id, OLD.state, NEW.state
+            USING ERRCODE = 'check_violation';
+    END IF;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER stock_ingestion_runs_check_state_transition
+    BEFORE UPDATE OF state ON stock_ingestion_runs
+    FOR EACH ROW
+    WHEN (OLD.state IS DISTINCT FROM NEW.state)
+    EXECUTE FUNCTION stock_ingestion_runs_check_state_transition();
+"""
+
+DROP_TRIGGER = """
+DROP TRIGGER IF EXISTS stock_ingestion_runs_check_state_transition ON stock_ingestion_runs;
+DROP FUNCTION IF EXISTS stock_ingestion_runs_check_state_transition();
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0017_updated_at_triggers'),
+    ]
+
+    operations = [
+        migrations.RunSQL(CREATE_TRIGGER, DROP_TRIGGER),
+    ]
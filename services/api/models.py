@@ -5,8 +5,18 @@ This module contains the database models for tracking stock ticker
 data through an ETL pipeline with multiple processing states.
 """
 
+import functools
+import os
+import time
 import uuid
-from django.db import models
+from collections.abc import Iterable
+from types import MappingProxyType
+
+from django.db import connections, models
+from django.db.models.functions import JSONObject, Upper
+from django.utils import timezone
+
+from api.cache_utils import get_cached_latest_done_run, set_cached_latest_done_run
 
 
 class IngestionState(models.TextChoices):
@@ -33,6 +43,69 @@ class IngestionState(models.TextChoices):
     FAILED = 'FAILED', 'Failed'
 
 
+class IngestionStateField(models.CharField):
+    """
+    Stores IngestionState values in the ingestion_state Postgres ENUM type.
+    
+    An enum value takes 4 bytes in rows and indexes, where the VARCHAR it
+    replaces took up to 17 bytes plus a length header, and compares as an
+    integer. Values are still read and written as the state strings.
+    
+    The type is created by migrations; a new IngestionState member needs a
+    migration running ALTER TYPE ingestion_state ADD VALUE.
+    """
+
+    def db_type(self, connection):
+        return 'ingestion_state'
+
+
+# States of runs still going through the pipeline (not DONE or FAILED)
+ACTIVE_INGESTION_STATES = [
+    IngestionState.QUEUED_FOR_FETCH,
+    IngestionState.FETCHING,
+    IngestionState.FETCHED,
+    IngestionState.QUEUED_FOR_DELTA,
+    IngestionState.DELTA_RUNNING,
+    IngestionState.DELTA_FINISHED,
+]
+
+# For membership tests in Python; querysets and constraints take the list above
+TERMINAL_INGESTION_STATES = frozenset({IngestionState.DONE, IngestionState.FAILED})
+
+# Choices for serializer and filter fields. A tuple of tuples of strings is
+# returned as is by deepcopy(), which every serializer and FilterSet instance
+# runs over its fields; IngestionState.choices is a list.
+INGESTION_STATE_CHOICES = tuple(IngestionState.choices)
+
+
+def uuid7() -> uuid.UUID:
+    """
+    Generate a time-ordered UUID (version 7, RFC 9562).
+    
+    The first 48 bits are the Unix time in milliseconds and the rest is
+    random, so keys generated one after another land next to each other in
+    the primary key index instead of on a random page. Used for the tables
+    with the most inserts.
+    """
+    timestamp_ms = time.time_ns() // 1_000_000
+    value = (timestamp_ms & 0xFFFF_FFFF_FFFF) << 80 | int.from_bytes(os.urandom(10))
+    # Version 7 in bits 76-79, RFC 9562 variant (0b10) in bits 62-63
+    value = value & ~(0xF << 76) | (0x7 << 76)
+    value = value & ~(0x3 << 62) | (0x2 << 62)
+    return uuid.UUID(int=value)
+
+
+@functools.lru_cache(maxsize=8192)
+def _normalize_identifier(value: str) -> str:
+    """
+    Normalize a ticker or exchange name: strip whitespace and uppercase.
+    
+    Cached, as the same few thousand tickers and exchange names are
+    normalized over and over.
+    """
+    return value.strip().upper()
+
+
 class Exchange(models.Model):
     """
     Represents a stock exchange where stocks are traded.
@@ -57,6 +130,10 @@ class Exchange(models.Model):
     class Meta:
         db_table = 'exchanges'
         ordering = ['name']
+        indexes = [
+            # Backs case-insensitive (iexact) lookups, which compare UPPER(name)
+            models.Index(Upper('name'), name='idx_exchange_name_upper'),
+        ]
 
     def save(self, *args, **kwargs):
         """
@@ -64,9 +141,14 @@ class Exchange(models.Model):
         
         This ensures consistent storage regardless of input case,
         preventing duplicate entries like 'nasdaq' and 'NASDAQ'.
+        
+        The database applies the same normalization in a trigger, which
+        also covers writes that bypass save() (bulk_create, update()).
+        Saves with update_fields that leave out name skip normalization.
         """
-        if self.name:
-            self.name = self.name.strip().upper()
+        update_fields = kwargs.get('update_fields')
+        if self.name and (update_fields is None or 'name' in update_fields):
+            self.name = _normalize_identifier(self.name)
         super().save(*args, **kwargs)
 
     def __str__(self) -> str:
@@ -100,6 +182,10 @@ class Sector(models.Model):
     class Meta:
         db_table = 'sectors'
         ordering = ['name']
+        indexes = [
+            # Backs case-insensitive (iexact) lookups, which compare UPPER(name)
+            models.Index(Upper('name'), name='idx_sector_name_upper'),
+        ]
 
     def __str__(self) -> str:
         return self.name
@@ -108,6 +194,44 @@ class Sector(models.Model):
         return f"<Sector(id={self.id}, name='{self.name}')>"
 
 
+# Rows per INSERT statement for StockIngestionRunManager.bulk_create_queued()
+BULK_CREATE_BATCH_SIZE = 10_000
+
+
+class StockManager(models.Manager):
+    """Custom manager for Stock with common query patterns."""
+
+    def with_latest_run(self) -> models.QuerySet:
+        """
+        Get stocks annotated with a summary of their latest ingestion run.
+        
+        The run is selected by a correlated subquery (served by
+        idx_run_stock_created_cover) and built into a JSON object in the
+        database, so stocks and their latest runs come back in one query
+        instead of one get_latest_for_stock() call per stock.
+        
+        Returns:
+            QuerySet of Stock objects with a latest_run annotation: a dict with
+            the run's id, state, is_terminal, created_at and updated_at, or
+            None if the stock has no runs
+        """
+        latest_run = (
+            StockIngestionRun.objects
+            .filter(stock_id=models.OuterRef('pk'))
+            .order_by('-created_at')
+            .values(
+                json=JSONObject(
+                    id='id',
+                    state='state',
+                    is_terminal='terminal',
+                    created_at='created_at',
+                    updated_at='updated_at',
+                )
+            )[:1]
+        )
+        return self.annotate(latest_run=models.Subquery(latest_run, output_field=models.JSONField()))
+
+
 class Stock(models.Model):
     """
     Represents a stock ticker symbol.
@@ -134,6 +258,10 @@ class Stock(models.Model):
         morningstar_industry: Morningstar industry classification
         industry: Industry classification
         description: Company description
+        latest_run_state: State of the stock's latest ingestion run (None if
+            it has no runs), maintained by the database
+        latest_run_at: Creation time of the stock's latest ingestion run,
+            maintained by the database
     """
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     ticker = models.CharField(max_length=20, unique=True, db_index=True)
@@ -165,9 +293,30 @@ class Stock(models.Model):
     industry = models.CharField(max_length=255, null=True, blank=True)
     description = models.TextField(null=True, blank=True)
 
+    # Denormalized from the latest run (by created_at) by triggers on
+    # stock_ingestion_runs, so listing stocks by pipeline state needs no join.
+    # Writes from the application are ignored: a stock saved from a stale
+    # instance can't overwrite them.
+    latest_run_state = IngestionStateField(
+        max_length=20,
+        choices=IngestionState.choices,
+        null=True,
+        blank=True,
+        editable=False,
+        db_index=True
+    )
+    latest_run_at = models.DateTimeField(null=True, blank=True, editable=False)
+
+    objects = StockManager()
+
     class Meta:
         db_table = 'stocks'
         ordering = ['ticker']
+        indexes = [
+            # Back case-insensitive (iexact) lookups, which compare UPPER(column)
+            models.Index(Upper('ticker'), name='idx_stock_ticker_upper'),
+            models.Index(Upper('country'), name='idx_stock_country_upper'),
+        ]
 
     def save(self, *args, **kwargs):
         """
@@ -175,9 +324,14 @@ class Stock(models.Model):
         
         This ensures consistent storage regardless of input case,
         preventing duplicate entries like 'aapl' and 'AAPL'.
+        
+        The database applies the same normalization in a trigger, which
+        also covers writes that bypass save() (bulk_create, update()).
+        Saves with update_fields that leave out ticker skip normalization.
         """
-        if self.ticker:
-            self.ticker = self.ticker.strip().upper()
+        update_fields = kwargs.get('update_fields')
+        if self.ticker and (update_fields is None or 'ticker' in update_fields):
+            self.ticker = _normalize_identifier(self.ticker)
         super().save(*args, **kwargs)
 
     def __str__(self) -> str:
@@ -187,6 +341,51 @@ class Stock(models.Model):
         return f"<Stock(id={self.id}, ticker='{self.ticker}')>"
 
 
+# Count of every ingestion state, copied for each bulk queue run's stats
+_EMPTY_STATE_COUNTS = MappingProxyType(dict.fromkeys(IngestionState.values, 0))
+
+
+class BulkQueueRunManager(models.Manager):
+    """Custom manager for BulkQueueRun with common query patterns."""
+
+    def get_ingestion_run_stats(self, bulk_queue_run_ids: Iterable[uuid.UUID]) -> dict[uuid.UUID, dict]:
+        """
+        Count the ingestion runs of bulk queue runs, in total and by state.
+        
+        One GROUP BY (bulk_queue_run_id, state) query covers all the given
+        bulk queue runs, so a page of them costs a single query, and each
+        run's ingestion runs are counted in one pass rather than once per
+        state.
+        
+        Args:
+            bulk_queue_run_ids: UUIDs of the bulk queue runs
+            
+        Returns:
+            Dictionary mapping each bulk queue run ID to a dictionary with
+            'total' count and 'by_state' dictionary mapping each IngestionState
+            value to its count (0 for states without runs)
+        """
+        stats = {
+            bulk_queue_run_id: {'total': 0, 'by_state': _EMPTY_STATE_COUNTS.copy()}
+            for bulk_queue_run_id in bulk_queue_run_ids
+        }
+        if not stats:
+            return stats
+        
+        state_counts = (
+            StockIngestionRun.objects
+            .filter(bulk_queue_run_id__in=list(stats))
+            .order_by()
+            .values_list('bulk_queue_run_id', 'state')
+            .annotate(count=models.Count('id'))
+        )
+        for bulk_queue_run_id, state, count in state_counts:
+            run_stats = stats[bulk_queue_run_id]
+            run_stats['by_state'][state] = count
+            run_stats['total'] += count
+        return stats
+
+
 class BulkQueueRun(models.Model):
     """
     Tracks statistics for bulk queue operations.
@@ -207,7 +406,7 @@ class BulkQueueRun(models.Model):
         started_at: When processing actually started (nullable)
         completed_at: When processing completed (nullable)
     """
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     
     # Request metadata
     requested_by = models.CharField(max_length=255, null=True, blank=True)
@@ -223,16 +422,51 @@ class BulkQueueRun(models.Model):
     started_at = models.DateTimeField(null=True, blank=True)
     completed_at = models.DateTimeField(null=True, blank=True)
 
+    objects = BulkQueueRunManager()
+
     class Meta:
         db_table = 'bulk_queue_runs'
         ordering = ['-created_at']
         indexes = [
             models.Index(fields=['-created_at'], name='idx_bulk_queue_created_at'),
+            # Incomplete runs and runs with errors are small slices of the
+            # history, filtered with ?is_completed=false and ?has_errors=true
+            models.Index(
+                fields=['-created_at'],
+                condition=models.Q(completed_at__isnull=True),
+                name='idx_bulk_queue_incomplete'
+            ),
+            models.Index(
+                fields=['-created_at'],
+                condition=models.Q(error_count__gt=0),
+                name='idx_bulk_queue_has_errors'
+            ),
         ]
 
     def __str__(self) -> str:
         return f"BulkQueueRun {self.id} - {self.queued_count}/{self.total_stocks} queued"
 
+    def increment(self, queued: int = 0, skipped: int = 0, errors: int = 0) -> None:
+        """
+        Atomically add to the run's counters in the database.
+        
+        Issues a single UPDATE ... SET queued_count = queued_count + %s, ...
+        without reading the row first, so concurrent increments are never lost.
+        The counters on this instance are not refreshed.
+        
+        Args:
+            queued: Number of stocks queued
+            skipped: Number of stocks skipped
+            errors: Number of stocks that failed to queue
+        """
+        if not (queued or skipped or errors):
+            return
+        BulkQueueRun.objects.filter(id=self.id).update(
+            queued_count=models.F('queued_count') + queued,
+            skipped_count=models.F('skipped_count') + skipped,
+            error_count=models.F('error_count') + errors,
+        )
+
     def __repr__(self) -> str:
         return (
             f"<BulkQueueRun(id={self.id}, total={self.total_stocks}, "
@@ -265,15 +499,20 @@ class StockIngestionRunManager(models.Manager):
         """
         Get the most recent ingestion run for a stock by ticker symbol.
         
+        The stock is resolved in a subquery on the unique ticker index, so the
+        runs are filtered on stock_id and read from idx_run_stock_created_cover
+        rather than joined against stocks on the ticker.
+        
         Args:
             ticker: Stock ticker symbol
             
         Returns:
             The latest StockIngestionRun or None if no runs exist
         """
+        stock_id = Stock.objects.filter(ticker=_normalize_identifier(ticker)).order_by().values('id')[:1]
         return (
             self.select_related('stock')
-            .filter(stock__ticker=ticker.strip().upper())
+            .filter(stock_id=models.Subquery(stock_id))
             .order_by('-created_at')
             .first()
         )
@@ -285,17 +524,119 @@ class StockIngestionRunManager(models.Manager):
         Returns:
             QuerySet of active StockIngestionRun objects
         """
-        terminal_states = [IngestionState.DONE, IngestionState.FAILED]
-        return self.exclude(state__in=terminal_states)
+        return self.filter(terminal=False)
+
+    def bulk_create_queued(
+        self,
+        stocks: list[Stock],
+        bulk_queue_run: BulkQueueRun | None = None,
+        requested_by: str | None = None,
+        request_id: str | None = None,
+        batch_size: int = BULK_CREATE_BATCH_SIZE,
+    ) -> list['StockIngestionRun']:
+        """
+        Create a QUEUED_FOR_FETCH run for each stock without an active run.
+        
+        Each batch is a single INSERT ... SELECT whose anti-join (NOT EXISTS,
+        served by the unique_active_run_per_stock index) skips stocks that
+        already have an active run, so callers neither look up the active runs
+        first nor lock the stocks. Runs queued concurrently are skipped by
+        ON CONFLICT DO NOTHING, and RETURNING reports the runs created.
+        
+        Args:
+            stocks: Stocks to queue
+            bulk_queue_run: BulkQueueRun to link the new runs to
+            requested_by: Identifier for the requesting entity
+            request_id: Request identifier stored on every run
+            batch_size: Number of rows per INSERT statement
+            
+        Returns:
+            The runs created, in the order of stocks
+        """
+        if not stocks:
+            return []
+        
+        runs = []
+        for stock in stocks:
+            # Timestamped one by one, like auto_now_add, so created_at keeps
+            # the runs in the order of stocks
+            created_at = timezone.now()
+            runs.append(self.model(
+                stock=stock,
+                state=IngestionState.QUEUED_FOR_FETCH,
+                requested_by=requested_by,
+                request_id=request_id,
+                bulk_queue_run=bulk_queue_run,
+                created_at=created_at,
+                updated_at=created_at,
+                queued_for_fetch_at=created_at,
+            ))
+        
+        table = self.model._meta.db_table
+        active_states = ', '.join(f"'{state}'" for state in ACTIVE_INGESTION_STATES)
+        sql = f"""
+            INSERT INTO {table} (
+                id, stock_id, state, bulk_queue_run_id, requested_by, request_id,
+                created_at, updated_at, queued_for_fetch_at
+            )
+            SELECT
+                new_run.id, new_run.stock_id, %s, %s, %s, %s,
+                new_run.created_at, new_run.created_at, new_run.created_at
+            FROM unnest(%s::uuid[], %s::uuid[], %s::timestamptz[])
+                AS new_run (id, stock_id, created_at)
+            WHERE NOT EXISTS (
+                SELECT 1 FROM {table} AS run
+                WHERE run.stock_id = new_run.stock_id AND run.state IN ({active_states})
+            )
+            ON CONFLICT DO NOTHING
+            RETURNING id
+        """
+        created_ids = set()
+        with connections[self.db].cursor() as cursor:
+            for batch_start in range(0, len(runs), batch_size):
+                batch = runs[batch_start:batch_start + batch_size]
+                cursor.execute(sql, [
+                    IngestionState.QUEUED_FOR_FETCH,
+                    bulk_queue_run.id if bulk_queue_run else None,
+                    requested_by,
+                    request_id,
+                    [str(run.id) for run in batch],
+                    [str(run.stock_id) for run in batch],
+                    [run.created_at for run in batch],
+                ])
+                created_ids.update(row[0] for row in cursor.fetchall())
+        
+        created_runs = [run for run in runs if run.id in created_ids]
+        for run in created_runs:
+            run._state.adding = False
+            run._state.db = self.db
+        return created_runs
     
     def get_latest_done_run(self, stock: Stock) -> 'StockIngestionRun | None':
-        """Get the latest DONE state run for a stock."""
-        return (
-            self.select_related('stock')
-            .filter(stock=stock, state=IngestionState.DONE)
-            .order_by('-created_at')
-            .first()
-        )
+        """
+        Get the latest DONE state run for a stock.
+        
+        Read through the cache (see api.cache_utils): the run's field values
+        are cached per stock until another of its runs reaches DONE. Stocks
+        without a DONE run aren't cached.
+        """
+        cached = get_cached_latest_done_run(stock.id)
+        if cached is not None:
+            run = self.model.from_db(self.db, list(cached), list(cached.values()))
+        else:
+            run = (
+                self.filter(stock=stock, state=IngestionState.DONE)
+                .order_by('-created_at')
+                .first()
+            )
+            if run is None:
+                return None
+            set_cached_latest_done_run(stock.id, {
+                field.attname: field.value_from_object(run)
+                for field in run._meta.concrete_fields
+            })
+        run.stock = stock
+        return run
 
 
 class StockIngestionRun(models.Model):
@@ -321,7 +662,7 @@ class StockIngestionRun(models.Model):
         raw_data_uri: URI to raw data location (e.g., S3)
         processed_data_uri: URI to processed data location (e.g., lakehouse)
     """
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     
     # Relationship to stock
     stock = models.ForeignKey(
@@ -346,15 +687,25 @@ class StockIngestionRun(models.Model):
     request_id = models.CharField(max_length=255, null=True, blank=True)
     
     # Current state
-    state = models.CharField(
+    state = IngestionStateField(
         max_length=20,
         choices=IngestionState.choices,
         default=IngestionState.QUEUED_FOR_FETCH,
         db_index=True
     )
     
+    # Whether the run is DONE or FAILED, computed by the database so queries can
+    # filter on it directly. save() doesn't refresh it on the instance; use the
+    # is_terminal property for the in-memory value.
+    terminal = models.GeneratedField(
+        expression=models.Q(state__in=[IngestionState.DONE, IngestionState.FAILED]),
+        output_field=models.BooleanField(),
+        db_persist=True,
+    )
+    
     # Lifecycle timestamps
     created_at = models.DateTimeField(auto_now_add=True)
+    # Set by save(); a database trigger also sets it for update() and raw SQL
     updated_at = models.DateTimeField(auto_now=True)
     
     # Phase-specific timestamps (optional, helpful for debugging/SLAs)
@@ -381,35 +732,63 @@ class StockIngestionRun(models.Model):
         db_table = 'stock_ingestion_runs'
         ordering = ['-created_at']
         indexes = [
-            models.Index(fields=['stock', '-created_at'], name='idx_run_stock_created_at'),
+            # Latest run per stock; state and id are included so lookups that
+            # only need them are answered from the index without heap fetches
+            models.Index(
+                fields=['stock', '-created_at'],
+                include=['state', 'id'],
+                name='idx_run_stock_created_cover'
+            ),
+            # Latest DONE run per stock (get_latest_done_run), without walking
+            # past the stock's newer runs in other states
+            models.Index(
+                fields=['stock', '-created_at'],
+                condition=models.Q(state=IngestionState.DONE),
+                name='idx_run_stock_done_created'
+            ),
+            # Run lists are ordered and cursor-paginated by -created_at, and
+            # filtered by created_at ranges
+            models.Index(fields=['-created_at'], name='idx_run_created_at'),
+            # Runs in progress are a small, hot slice of a table dominated by
+            # finished runs; keep a small index over just them, in list order
+            models.Index(
+                fields=['-created_at'],
+                condition=models.Q(terminal=False),
+                name='idx_active_runs'
+            ),
         ]
         constraints = [
             models.UniqueConstraint(
                 fields=['stock'],
-                condition=models.Q(state__in=[
-                    IngestionState.QUEUED_FOR_FETCH,
-                    IngestionState.FETCHING,
-                    IngestionState.FETCHED,
-                    IngestionState.QUEUED_FOR_DELTA,
-                    IngestionState.DELTA_RUNNING,
-                    IngestionState.DELTA_FINISHED,
-                ]),
+                condition=models.Q(state__in=ACTIVE_INGESTION_STATES),
                 name='unique_active_run_per_stock'
             )
         ]
 
+    def _stock_label(self) -> str:
+        """
+        Return the stock's ticker if it's known without a query, else its ID.
+        
+        The ticker comes from an already loaded stock (e.g.
+        select_related('stock')), so formatting runs never issues one query
+        per run.
+        """
+        if StockIngestionRun.stock.is_cached(self):
+            return self.stock.ticker
+        return str(self.stock_id)
+
     def __str__(self) -> str:
-        return f"{self.stock.ticker} - {self.state} ({self.id})"
+        return f"{self._stock_label()} - {self.state} ({self.id})"
 
     def __repr__(self) -> str:
-        return f"<StockIngestionRun(id={self.id}, stock='{self.stock.ticker}', state='{self.state}')>"
+        return f"<StockIngestionRun(id={self.id}, stock='{self._stock_label()}', state='{self.state}')>"
 
     @property
     def is_terminal(self) -> bool:
         """Check if the run is in a terminal state (DONE or FAILED)."""
-        return self.state in [IngestionState.DONE, IngestionState.FAILED]
+        return self.state in TERMINAL_INGESTION_STATES
 
     @property
     def is_in_progress(self) -> bool:
         """Check if the run is currently in progress."""
-        return not self.is_terminal
+        return self.state not in TERMINAL_INGESTION_STATES
@@ -5,9 +5,66 @@ This module contains DRF serializers for validating input and
 serializing output for the stock ingestion API endpoints.
 """
 
+import copy
+import re
+
+from django.db.models import QuerySet
+from django.utils.dateparse import parse_datetime
 from rest_framework import serializers
 
-from api.models import BulkQueueRun, Exchange, IngestionState, Sector, Stock, StockIngestionRun
+from api.models import (
+    INGESTION_STATE_CHOICES,
+    BulkQueueRun,
+    Exchange,
+    Sector,
+    Stock,
+    StockIngestionRun,
+)
+
+# Normalized ticker symbols: ASCII letters and digits only
+_TICKER_RE = re.compile(r'[A-Z0-9]{1,10}')
+
+# StockIngestionRunSerializer only reads the ticker of a run's stock
+_RUN_DEFERRED_STOCK_FIELDS = tuple(
+    f'stock__{field.name}'
+    for field in Stock._meta.concrete_fields
+    if field.name not in ('id', 'ticker')
+)
+
+
+class CachedFieldsMixin:
+    """
+    Serializer mixin building the serializer's fields once per class.
+    
+    ModelSerializer.get_fields() introspects the model and builds every field
+    again for each serializer instance, i.e. on every request. The fields
+    built on first use are kept on the class instead, and each instance gets
+    copies of them to bind, so the cached fields are never bound themselves.
+    Plain fields are copied shallowly; nested serializers are deep-copied, as
+    they hold their own bound child fields.
+    
+    Only for serializers whose fields don't depend on the instance, context
+    or request.
+    """
+    _cached_fields = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Subclasses may declare other fields; each class caches its own
+        cls._cached_fields = None
+
+    def get_fields(self) -> dict:
+        cls = type(self)
+        if cls._cached_fields is None:
+            cls._cached_fields = super().get_fields()
+        return {
+            field_name: (
+                copy.deepcopy(field)
+                if isinstance(field, serializers.BaseSerializer)
+                else copy.copy(field)
+            )
+            for field_name, field in cls._cached_fields.items()
+        }
 
 
 class ExchangeSerializer(serializers.ModelSerializer):
@@ -48,7 +105,7 @@ class SectorSerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'created_at', 'updated_at']
 
 
-class StockSerializer(serializers.ModelSerializer):
+class StockSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for the Stock model.
     
@@ -57,9 +114,12 @@ class StockSerializer(serializers.ModelSerializer):
     to the Exchange model, and the sector field is a ForeignKey to the Sector
     model. For backward compatibility, we provide both the foreign key IDs
     and human-readable names (exchange_name and sector_name) as separate fields.
+    Both names are None for stocks without an exchange or sector. Querysets
+    should select_related('exchange', 'sector') to read them without a query
+    per stock.
     """
-    exchange_name = serializers.SerializerMethodField()
-    sector_name = serializers.SerializerMethodField()
+    exchange_name = serializers.CharField(source='exchange.name', read_only=True, default=None)
+    sector_name = serializers.CharField(source='sector.name', read_only=True, default=None)
 
     class Meta:
         model = Stock
@@ -82,26 +142,8 @@ class StockSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['id', 'created_at', 'updated_at', 'exchange', 'exchange_name', 'sector', 'sector_name']
 
-    def get_exchange_name(self, obj: Stock) -> str | None:
-        """
-        Get the exchange name from the related Exchange model.
-        
-        Returns None if no exchange is associated with the stock.
-        This maintains backward compatibility with the previous CharField implementation.
-        """
-        return obj.exchange.name if obj.exchange else None
-
-    def get_sector_name(self, obj: Stock) -> str | None:
-        """
-        Get the sector name from the related Sector model.
-        
-        Returns None if no sector is associated with the stock.
-        This maintains backward compatibility with the previous CharField implementation.
-        """
-        return obj.sector.name if obj.sector else None
 
-
-class StockIngestionRunSerializer(serializers.ModelSerializer):
+class StockIngestionRunSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for the StockIngestionRun model.
     
@@ -148,8 +190,26 @@ class StockIngestionRunSerializer(serializers.ModelSerializer):
             'is_in_progress',
         ]
 
+    @staticmethod
+    def setup_eager_loading(queryset: QuerySet) -> QuerySet:
+        """
+        Load the related objects this serializer reads along with the runs.
+        
+        Joins each run's stock, selecting only its ticker (the stock's profile
+        columns are deferred), so serializing many runs doesn't query the
+        stock of each run. Querysets of runs to serialize should go through
+        this, e.g. in list views.
+        
+        Args:
+            queryset: QuerySet of StockIngestionRun objects
+            
+        Returns:
+            The queryset, joined with the stock's ticker
+        """
+        return queryset.select_related('stock').defer(*_RUN_DEFERRED_STOCK_FIELDS)
 
-class StockStatusResponseSerializer(serializers.Serializer):
+
+class StockStatusResponseSerializer(CachedFieldsMixin, serializers.Serializer):
     """
     Serializer for the stock status response.
     
@@ -160,13 +220,50 @@ class StockStatusResponseSerializer(serializers.Serializer):
     stock_id = serializers.UUIDField()
     run_id = serializers.UUIDField(allow_null=True)
     state = serializers.ChoiceField(
-        choices=IngestionState.choices,
+        choices=INGESTION_STATE_CHOICES,
         allow_null=True
     )
     created_at = serializers.DateTimeField(allow_null=True)
     updated_at = serializers.DateTimeField(allow_null=True)
 
 
+class _JSONDateTimeField(serializers.DateTimeField):
+    """DateTimeField for timestamps decoded from JSON built by the database."""
+
+    def to_representation(self, value):
+        # DateTimeField returns strings untouched; parse them so they're
+        # rendered in the same format as every other timestamp
+        if isinstance(value, str):
+            value = parse_datetime(value)
+        return super().to_representation(value)
+
+
+class LatestRunSummarySerializer(serializers.Serializer):
+    """
+    Serializer for the latest run summary built by Stock.objects.with_latest_run().
+    
+    The summary is a dict decoded from the JSON object built by the database,
+    so its timestamps arrive as strings in Postgres's format.
+    """
+    id = serializers.UUIDField()
+    state = serializers.ChoiceField(choices=INGESTION_STATE_CHOICES)
+    is_terminal = serializers.BooleanField()
+    created_at = _JSONDateTimeField()
+    updated_at = _JSONDateTimeField()
+
+
+class StockLatestRunSerializer(serializers.Serializer):
+    """
+    Serializer for a stock together with a summary of its latest ingestion run.
+    
+    Expects stocks from Stock.objects.with_latest_run(): latest_run is the
+    dict built by the database (id, state, is_terminal, created_at,
+    updated_at), or null if the stock has no runs.
+    """
+    stock = StockSerializer(source='*', read_only=True)
+    latest_run = LatestRunSummarySerializer(read_only=True, allow_null=True)
+
+
 class BulkQueueRunSerializer(serializers.ModelSerializer):
     """
     Serializer for the BulkQueueRun model.
@@ -196,7 +293,7 @@ class BulkQueueRunSerializer(serializers.ModelSerializer):
         ]
 
 
-class QueueForFetchRequestSerializer(serializers.Serializer):
+class QueueForFetchRequestSerializer(CachedFieldsMixin, serializers.Serializer):
     """
     Serializer for validating queue-for-fetch requests.
     
@@ -228,21 +325,16 @@ class QueueForFetchRequestSerializer(serializers.Serializer):
         # Normalize to uppercase
         normalized = value.upper().strip()
         
-        # Basic validation for ticker format
-        if not normalized.isalnum():
+        # Longer input is rejected by the field's max_length before this runs
+        if not _TICKER_RE.fullmatch(normalized):
             raise serializers.ValidationError(
                 "Ticker symbol must contain only alphanumeric characters"
             )
         
-        if len(normalized) > 10:
-            raise serializers.ValidationError(
-                "Ticker symbol must be 10 characters or fewer"
-            )
-        
         return normalized
 
 
-class QueueAllStocksRequestSerializer(serializers.Serializer):
+class QueueAllStocksRequestSerializer(CachedFieldsMixin, serializers.Serializer):
     """
     Serializer for validating queue-all-stocks requests.
     
@@ -278,8 +370,9 @@ class BulkQueueRunStatsSerializer(serializers.ModelSerializer):
     
     This serializer is used for the bulk queue run stats detail endpoint which
     provides comprehensive statistics about the ingestion runs created by a
-    bulk queue operation. The aggregation is performed efficiently using
-    database annotations to minimize query overhead.
+    bulk queue operation. Pass the stats of the serialized runs from
+    BulkQueueRun.objects.get_ingestion_run_stats() as the
+    'ingestion_run_stats' context entry to count them all in one query.
     
     Fields:
         All fields from BulkQueueRun (id, requested_by, total_stocks, queued_count,
@@ -312,11 +405,11 @@ class BulkQueueRunStatsSerializer(serializers.ModelSerializer):
 
     def get_ingestion_run_stats(self, obj: BulkQueueRun) -> dict:
         """
-        Aggregate statistics from all related StockIngestionRun objects.
+        Return the ingestion run statistics of obj.
         
-        Groups ingestion runs by state and provides total count and counts
-        for each IngestionState. Uses efficient database aggregation to
-        minimize query overhead.
+        Read from the 'ingestion_run_stats' context entry, built for every
+        serialized run by BulkQueueRun.objects.get_ingestion_run_stats() in a
+        single query. Without it, the stats of obj are queried on their own.
         
         Args:
             obj: BulkQueueRun instance
@@ -338,33 +431,9 @@ class BulkQueueRunStatsSerializer(serializers.ModelSerializer):
                 }
             }
         """
-        from django.db.models import Count
-        
-        # Get all related ingestion runs and aggregate by state
-        ingestion_runs = obj.ingestion_runs.all()
-        
-        # Aggregate counts by state using database aggregation
-        state_counts = (
-            ingestion_runs
-            .values('state')
-            .annotate(count=Count('id'))
-            .order_by('state')
-        )
-        
-        # Build the by_state dictionary, initializing all states to 0
-        by_state = {state[0]: 0 for state in IngestionState.choices}
-        
-        # Populate with actual counts
-        total = 0
-        for item in state_counts:
-            state = item['state']
-            count = item['count']
-            by_state[state] = count
-            total += count
-        
-        return {
-            'total': total,
-            'by_state': by_state,
-        }
+        stats = self.context.get('ingestion_run_stats')
+        if stats is None:
+            stats = BulkQueueRun.objects.get_ingestion_run_stats([obj.id])
+        return stats[obj.id]
 
 
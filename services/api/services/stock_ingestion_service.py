@@ -12,10 +12,15 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional
 
-from django.db import transaction
+from django.db import IntegrityError, transaction
 from django.utils import timezone
 
-from api.models import IngestionState, Stock, StockIngestionRun
+from api.models import (
+    ACTIVE_INGESTION_STATES,
+    IngestionState,
+    Stock,
+    StockIngestionRun,
+)
 
 
 logger = logging.getLogger(__name__)
@@ -58,15 +63,15 @@ class StatusResult:
 
 
 # Valid state transitions mapping
-VALID_TRANSITIONS: dict[str, list[str]] = {
-    IngestionState.QUEUED_FOR_FETCH: [IngestionState.FETCHING, IngestionState.FAILED],
-    IngestionState.FETCHING: [IngestionState.FETCHED, IngestionState.FAILED],
-    IngestionState.FETCHED: [IngestionState.QUEUED_FOR_DELTA, IngestionState.FAILED],
-    IngestionState.QUEUED_FOR_DELTA: [IngestionState.DELTA_RUNNING, IngestionState.FAILED],
-    IngestionState.DELTA_RUNNING: [IngestionState.DELTA_FINISHED, IngestionState.FAILED],
-    IngestionState.DELTA_FINISHED: [IngestionState.DONE, IngestionState.FAILED],
-    IngestionState.DONE: [],  # Terminal state
-    IngestionState.FAILED: [],  # Terminal state
+VALID_TRANSITIONS: dict[str, frozenset[str]] = {
+    IngestionState.QUEUED_FOR_FETCH: frozenset({IngestionState.FETCHING, IngestionState.FAILED}),
+    IngestionState.FETCHING: frozenset({IngestionState.FETCHED, IngestionState.FAILED}),
+    IngestionState.FETCHED: frozenset({IngestionState.QUEUED_FOR_DELTA, IngestionState.FAILED}),
+    IngestionState.QUEUED_FOR_DELTA: frozenset({IngestionState.DELTA_RUNNING, IngestionState.FAILED}),
+    IngestionState.DELTA_RUNNING: frozenset({IngestionState.DELTA_FINISHED, IngestionState.FAILED}),
+    IngestionState.DELTA_FINISHED: frozenset({IngestionState.DONE, IngestionState.FAILED}),
+    IngestionState.DONE: frozenset(),  # Terminal state
+    IngestionState.FAILED: frozenset(),  # Terminal state
 }
 
 # Mapping of states to their corresponding timestamp fields
@@ -111,29 +116,37 @@ class StockIngestionService:
         """
         ticker_upper = ticker.strip().upper()
         
-        try:
-            stock = Stock.objects.get(ticker=ticker_upper)
-        except Stock.DoesNotExist as err:
-            logger.warning("stock_not_found", extra={"ticker": ticker_upper})
-            raise StockNotFoundError(f"Stock '{ticker_upper}' not found") from err
-
-        latest_run = StockIngestionRun.objects.get_latest_for_stock(stock.id)
+        # The latest run is looked up by ticker, joining its stock, so
+        # the stock itself is only queried when it has no runs
+        latest_run = (
+            StockIngestionRun.objects
+            .filter(stock__ticker=ticker_upper)
+            .order_by('-created_at')
+            .values('id', 'state', 'created_at', 'updated_at', 'stock_id', 'stock__ticker')
+            .first()
+        )
         
         if latest_run:
             logger.debug(
-                f"Retrieved status for {ticker_upper}: state={latest_run.state}, "
-                f"run_id={latest_run.id}"
+                "Retrieved status for %s: state=%s, run_id=%s",
+                ticker_upper, latest_run['state'], latest_run['id']
             )
             return StatusResult(
-                ticker=stock.ticker,
-                stock_id=stock.id,
-                run_id=latest_run.id,
-                state=latest_run.state,
-                created_at=latest_run.created_at,
-                updated_at=latest_run.updated_at,
+                ticker=latest_run['stock__ticker'],
+                stock_id=latest_run['stock_id'],
+                run_id=latest_run['id'],
+                state=latest_run['state'],
+                created_at=latest_run['created_at'],
+                updated_at=latest_run['updated_at'],
             )
         
-        logger.debug(f"No ingestion runs found for {ticker_upper}")
+        try:
+            stock = Stock.objects.only('id', 'ticker').get(ticker=ticker_upper)
+        except Stock.DoesNotExist as err:
+            logger.warning("stock_not_found", extra={"ticker": ticker_upper})
+            raise StockNotFoundError(f"Stock '{ticker_upper}' not found") from err
+        
+        logger.debug("No ingestion runs found for %s", ticker_upper)
         return StatusResult(
             ticker=stock.ticker,
             stock_id=stock.id,
@@ -155,7 +168,7 @@ class StockIngestionService:
         )
         
         if created:
-            logger.info(f"Created new stock: {ticker_upper}")
+            logger.info("Created new stock: %s", ticker_upper)
         
         return stock, created
 
@@ -203,15 +216,20 @@ class StockIngestionService:
             processed_data_uri: URI to processed data location (optional)
             
         Returns:
-            Updated StockIngestionRun instance
+            Updated StockIngestionRun instance, partially loaded: only id,
+            state, stock_id and the fields set by this call are loaded.
+            Reading any other field (e.g. requested_by, created_at or another
+            state's timestamp) runs a query per field; use get_run_by_id()
+            for the full run.
             
         Raises:
             IngestionRunNotFoundError: If the run doesn't exist
             InvalidStateTransitionError: If the transition is not allowed
         """
-        # Lock the row for update
+        # Lock the row for update, loading only what's read below; the
+        # fields this sets are loaded by assigning them
         try:
-            run = StockIngestionRun.objects.select_for_update().get(id=run_id)
+            run = StockIngestionRun.objects.select_for_update().only('state', 'stock').get(id=run_id)
         except StockIngestionRun.DoesNotExist as err:
             logger.exception("ingestion_run_not_found", extra={"run_id": str(run_id)})
             raise IngestionRunNotFoundError(f"Ingestion run '{run_id}' not found") from err
@@ -219,24 +237,26 @@ class StockIngestionService:
         current_state = run.state
         
         # Validate state transition
-        valid_next_states = VALID_TRANSITIONS.get(current_state, [])
+        valid_next_states = VALID_TRANSITIONS.get(current_state, frozenset())
         if new_state not in valid_next_states:
             logger.warning(
-                f"Invalid state transition for run {run_id}: "
-                f"{current_state} -> {new_state}"
+                "Invalid state transition for run %s: %s -> %s",
+                run_id, current_state, new_state
             )
             raise InvalidStateTransitionError(
                 f"Cannot transition from '{current_state}' to '{new_state}'. "
-                f"Valid transitions: {valid_next_states}"
+                f"Valid transitions: {sorted(valid_next_states)}"
             )
         
         # Update state and timestamp
         run.state = new_state
+        update_fields = ['state', 'updated_at']
         
         # Set the appropriate timestamp field
         timestamp_field = STATE_TIMESTAMP_FIELDS.get(new_state)
         if timestamp_field:
             setattr(run, timestamp_field, timezone.now())
+            update_fields.append(timestamp_field)
         
         # Update error information if transitioning to FAILED
         if new_state == IngestionState.FAILED:
@@ -246,6 +266,7 @@ class StockIngestionService:
                 )
             run.error_code = error_code
             run.error_message = error_message
+            update_fields += ['error_code', 'error_message']
 
             # Schedule Discord notification to be sent after transaction commits
             # This ensures notification is only sent if the state update succeeds
@@ -254,13 +275,17 @@ class StockIngestionService:
         # Update data URIs if provided
         if raw_data_uri is not None:
             run.raw_data_uri = raw_data_uri
+            update_fields.append('raw_data_uri')
         if processed_data_uri is not None:
             run.processed_data_uri = processed_data_uri
+            update_fields.append('processed_data_uri')
         
-        run.save()
+        # Only the columns changed above are written; post_save still fires
+        # (see api.signals.invalidate_latest_done_run_cache)
+        run.save(update_fields=update_fields)
         
         logger.info(
-            f"Updated run {run_id} state: {current_state} -> {new_state}"
+            "Updated run %s state: %s -> %s", run_id, current_state, new_state
         )
         
         return run
@@ -278,13 +303,14 @@ class StockIngestionService:
         If the stock has an active (non-terminal) ingestion run, returns
         that run without creating a new one.
         
-        This operation relies on a unique database constraint combined with
-        transaction.atomic to detect and handle concurrent requests. When
-        multiple requests try to queue the same stock simultaneously, conflicts
-        are detected via IntegrityError raised by the unique constraint violation.
-        The IntegrityError bubbles up to the view layer, which handles it by
-        returning a 409 Conflict response (or fetching the existing run, depending
-        on the view implementation).
+        The stock's latest_run_state tells whether it has an active run, so
+        the runs are only queried to return that run. The new run is inserted
+        with StockIngestionRun.objects.bulk_create_queued(), a single INSERT
+        that skips the stock if it has an active run (ON CONFLICT DO NOTHING
+        on the unique_active_run_per_stock constraint), so a run queued by a
+        concurrent request is returned instead. If that run is no longer
+        active by the time it's read, IntegrityError is raised; the view
+        layer handles it by returning a 409 Conflict response.
         
         Args:
             ticker: Stock ticker symbol (case-insensitive)
@@ -295,41 +321,52 @@ class StockIngestionService:
             Tuple of (StockIngestionRun, created boolean)
             - If run already existed: (existing_run, False)
             - If new run created: (new_run, True)
+            
+        Raises:
+            IntegrityError: If a concurrent request's run kept the new run
+                from being created and was no longer active when read
         """
         ticker_upper = ticker.strip().upper()
         
         # Get or create the stock
         stock, _stock_created = self.get_or_create_stock(ticker_upper)
         
-        # Check for existing active run
-        latest_run = StockIngestionRun.objects.get_latest_for_stock(stock.id)
-        
-        if latest_run and latest_run.is_in_progress:
-            logger.debug(
-                f"Active run exists for {ticker_upper}: state={latest_run.state}, "
-                f"run_id={latest_run.id}"
-            )
-            return latest_run, False
+        if stock.latest_run_state in ACTIVE_INGESTION_STATES:
+            latest_run = StockIngestionRun.objects.get_latest_for_stock(stock.id)
+            if latest_run and latest_run.is_in_progress:
+                logger.debug(
+                    "Active run exists for %s: state=%s, run_id=%s",
+                    ticker_upper, latest_run.state, latest_run.id
+                )
+                return latest_run, False
         
         # Generate request_id if not provided
         if request_id is None:
             request_id = timezone.now().strftime('%Y%m%d%H%M%S%f')
         
-        # Create new run - IntegrityError will bubble up to view if constraint violated
-        now = timezone.now()
-        new_run = StockIngestionRun.objects.create(
-            stock=stock,
-            state=IngestionState.QUEUED_FOR_FETCH,
+        new_runs = StockIngestionRun.objects.bulk_create_queued(
+            [stock],
             requested_by=requested_by,
             request_id=request_id,
-            queued_for_fetch_at=now,
         )
+        if not new_runs:
+            # Another request queued a run since the stock was read
+            latest_run = StockIngestionRun.objects.get_latest_for_stock(stock.id)
+            if latest_run is None or not latest_run.is_in_progress:
+                raise IntegrityError(
+                    f"Active ingestion run for {ticker_upper} changed while queuing"
+                )
+            logger.debug(
+                "Active run created concurrently for %s: state=%s, run_id=%s",
+                ticker_upper, latest_run.state, latest_run.id
+            )
+            return latest_run, False
         
+        new_run = new_runs[0]
         logger.info(
-            f"Created new ingestion run for {ticker_upper}: "
-            f"run_id={new_run.id}, request_id={request_id}"
+            "Created new ingestion run for %s: run_id=%s, request_id=%s",
+            ticker_upper, new_run.id, request_id
         )
-
         
         return new_run, True
     
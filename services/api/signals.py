@@ -11,6 +11,8 @@ Signal Handlers:
       caches when Sector model is saved or deleted
     - invalidate_stock_list_cache: Invalidates TickerListView cache when Stock
       model is saved or deleted
+    - invalidate_latest_done_run_cache: Drops a stock's cached latest DONE run
+      when one of its DONE runs is saved or deleted
 
 When Signals Fire:
     - post_save: Fires after a model instance is saved (both created and updated)
@@ -28,6 +30,10 @@ Cache Invalidation Strategy:
     When a Stock is created/updated/deleted:
     - TickerListView cache is invalidated (direct impact)
 
+Invalidation runs when the surrounding transaction commits (see
+api.cache_utils.schedule_list_view_cache_invalidation), so rolled back changes
+don't invalidate anything and bulk changes invalidate each view once per transaction.
+
 Note:
     Both created and updated cases are handled by post_save signal (it fires
     for both operations). The signal handler doesn't need to distinguish
@@ -39,8 +45,11 @@ import logging
 from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
-from api.cache_utils import invalidate_list_view_cache
-from api.models import Exchange, Sector, Stock
+from api.cache_utils import (
+    schedule_latest_done_run_cache_invalidation,
+    schedule_list_view_cache_invalidation,
+)
+from api.models import Exchange, IngestionState, Sector, Stock, StockIngestionRun
 
 logger = logging.getLogger(__name__)
 
@@ -72,7 +81,8 @@ def invalidate_exchange_list_cache(sender, **kwargs):
     was_created = kwargs.get('created', False) if signal_type == 'post_save' else None
     
     logger.debug(
-        f"Exchange {signal_type} signal received, invalidating list view caches",
+        "Exchange %s signal received, invalidating list view caches",
+        signal_type,
         extra={
             'exchange_id': str(instance.id) if instance else None,
             'exchange_name': instance.name if instance else None,
@@ -82,10 +92,10 @@ def invalidate_exchange_list_cache(sender, **kwargs):
     )
     
     # Invalidate ExchangeListView cache (direct impact)
-    invalidate_list_view_cache('api:exchange-list')
+    schedule_list_view_cache_invalidation('api:exchange-list')
     
     # Invalidate TickerListView cache (stocks reference exchanges)
-    invalidate_list_view_cache('api:ticker-list')
+    schedule_list_view_cache_invalidation('api:ticker-list')
 
 
 @receiver([post_save, post_delete], sender=Sector)
@@ -115,7 +125,8 @@ def invalidate_sector_list_cache(sender, **kwargs):
     was_created = kwargs.get('created', False) if signal_type == 'post_save' else None
     
     logger.debug(
-        f"Sector {signal_type} signal received, invalidating list view caches",
+        "Sector %s signal received, invalidating list view caches",
+        signal_type,
         extra={
             'sector_id': str(instance.id) if instance else None,
             'sector_name': instance.name if instance else None,
@@ -125,10 +136,10 @@ def invalidate_sector_list_cache(sender, **kwargs):
     )
     
     # Invalidate SectorListView cache (direct impact)
-    invalidate_list_view_cache('api:sector-list')
+    schedule_list_view_cache_invalidation('api:sector-list')
     
     # Invalidate TickerListView cache (stocks reference sectors)
-    invalidate_list_view_cache('api:ticker-list')
+    schedule_list_view_cache_invalidation('api:ticker-list')
 
 
 @receiver([post_save, post_delete], sender=Stock)
@@ -154,7 +165,8 @@ def invalidate_stock_list_cache(sender, **kwargs):
     was_created = kwargs.get('created', False) if signal_type == 'post_save' else None
     
     logger.debug(
-        f"Stock {signal_type} signal received, invalidating list view cache",
+        "Stock %s signal received, invalidating list view cache",
+        signal_type,
         extra={
             'stock_id': str(instance.id) if instance else None,
             'ticker': instance.ticker if instance else None,
@@ -164,5 +176,22 @@ def invalidate_stock_list_cache(sender, **kwargs):
     )
     
     # Invalidate TickerListView cache (direct impact)
-    invalidate_list_view_cache('api:ticker-list')
+    schedule_list_view_cache_invalidation('api:ticker-list')
+
 
+@receiver([post_save, post_delete], sender=StockIngestionRun)
+def invalidate_latest_done_run_cache(sender, **kwargs):
+    """
+    Drop the cached latest DONE run of a stock when one of its DONE runs changes.
+    
+    Covers runs saved in (or into) the DONE state and deleted DONE runs.
+    
+    Args:
+        sender: The StockIngestionRun model class
+        **kwargs: Signal arguments including 'instance'
+    """
+    instance = kwargs.get('instance')
+    if instance is None or instance.state != IngestionState.DONE:
+        return
+    
+    schedule_latest_done_run_cache_invalidation([instance.stock_id], using=kwargs.get('using'))
@@ -3,6 +3,7 @@ Tests for Stock Ticker ETL Pipeline API.
 
 This module contains comprehensive tests for:
 - Models (Stock, StockIngestionRun)
+- Serializers
 - Service layer (StockIngestionService)
 - API endpoints
 """
@@ -11,19 +12,23 @@ from .models import (
     ExchangeModelTest,
     StockExchangeForeignKeyTest,
     StockModelTest, 
+    StockLatestRunTest,
     StockIngestionRunModelTest, 
     StockIngestionRunManagerTest,
     BulkQueueRunModelTest,
     BulkQueueRunRelationshipTest,
 )
+from .serializers import CachedFieldsMixinTest
 from .services import StockIngestionServiceTest, StockIngestionServiceTransactionTest, StateTransitionTest
 from .views import (
     StockStatusAPITest,
     QueueForFetchAPITest,
     RunDetailAPITest,
     TickerListAPITest,
+    TickerLatestRunListAPITest,
     TickerDetailAPITest,
     RunListAPITest,
+    RunSummaryListAPITest,
     TickerRunsListAPITest,
     QueueAllStocksForFetchAPITest,
     BulkQueueRunListAPITest,
@@ -37,7 +42,8 @@ from .filters import (
     RunListFilterAPITest, 
     TickerRunsListFilterAPITest, 
     BulkQueueRunFilterAPITest,
-    BulkQueueRunListFilterAPITest
+    BulkQueueRunListFilterAPITest,
+    QueryParamFilterBackendTest
 )
 from .auth import (
     AuthenticationRequiredAPITest,
@@ -48,17 +54,21 @@ from .cache_invalidation import (
     TickerListViewCacheTest, 
     CacheInvalidationUtilityTest, 
     CacheInvalidationSignalsTest, 
-    SectorListViewCacheTest
+    SectorListViewCacheTest,
+    ScheduleListViewCacheInvalidationTest,
+    LatestDoneRunCacheTest
 )
 
 __all__ = [
     'ExchangeModelTest',
     'StockExchangeForeignKeyTest',
     'StockModelTest',
+    'StockLatestRunTest',
     'StockIngestionRunModelTest',
     'StockIngestionRunManagerTest',
     'BulkQueueRunModelTest',
     'BulkQueueRunRelationshipTest',
+    'CachedFieldsMixinTest',
     'StockIngestionServiceTest',
     'StockIngestionServiceTransactionTest',
     'StateTransitionTest',
@@ -66,8 +76,10 @@ __all__ = [
     'QueueForFetchAPITest',
     'RunDetailAPITest',
     'TickerListAPITest',
+    'TickerLatestRunListAPITest',
     'TickerDetailAPITest',
     'RunListAPITest',
+    'RunSummaryListAPITest',
     'TickerRunsListAPITest',
     'TickerListFilterAPITest',
     'RunListFilterAPITest',
@@ -86,5 +98,8 @@ __all__ = [
     'CacheInvalidationUtilityTest', 
     'CacheInvalidationSignalsTest',
     'SectorListAPITest',
-    'SectorListViewCacheTest'
+    'SectorListViewCacheTest',
+    'ScheduleListViewCacheInvalidationTest',
+    'LatestDoneRunCacheTest',
+    'QueryParamFilterBackendTest'
 ]
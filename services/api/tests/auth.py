@@ -8,6 +8,7 @@ This test module covers:
 """
 
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APITestCase
@@ -22,6 +23,10 @@ class AuthenticationRequiredAPITest(APITestCase):
 
     def setUp(self):
         """Set up test fixtures."""
+        # List views are cached; drop pages cached by other tests, whose
+        # invalidation only happens on commit
+        cache.clear()
+        
         # Create test data
         self.exchange = Exchange.objects.create(name='NASDAQ')
         self.stock = Stock.objects.create(
@@ -81,6 +86,13 @@ class AuthenticationRequiredAPITest(APITestCase):
         
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
 
+    def test_run_summary_list_requires_authentication(self):
+        """Test that GET /api/runs/summary requires authentication."""
+        url = reverse('api:run-summary-list')
+        response = self.client.get(url)
+        
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
     def test_ticker_runs_list_requires_authentication(self):
         """Test that GET /api/runs/ticker/<ticker> requires authentication."""
         url = reverse('api:ticker-runs-list', kwargs={'ticker': 'AAPL'})
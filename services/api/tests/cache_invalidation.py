@@ -8,6 +8,11 @@ This test module covers:
 - Signal-based cache invalidation (post_save, post_delete)
 - Cache invalidation for all paginated pages
 - Edge cases (empty results, single page, large result sets)
+- Scheduling invalidation on transaction commit (deduplication, rollback)
+- Read-through caching of each stock's latest DONE ingestion run
+
+Signal handlers invalidate from transaction.on_commit(), so tests that exercise
+signals run in autocommit (APITransactionTestCase).
 """
 
 import time
@@ -15,17 +20,25 @@ from unittest.mock import patch
 
 from django.contrib.auth import get_user_model
 from django.core.cache import cache
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from rest_framework import status
-from rest_framework.test import APITestCase
+from rest_framework.test import APITestCase, APITransactionTestCase
 
-from api.cache_utils import invalidate_list_view_cache
-from api.models import Exchange, Sector, Stock
+from api.cache_utils import (
+    _redis_clients,
+    get_latest_done_run_cache_key,
+    get_list_view_cache_version,
+    invalidate_list_view_cache,
+    schedule_list_view_cache_invalidation,
+)
+from api.models import Exchange, IngestionState, Sector, Stock, StockIngestionRun
 
 User = get_user_model()
 
 
-class ExchangeListViewCacheTest(APITestCase):
+class ExchangeListViewCacheTest(APITransactionTestCase):
     """Tests for ExchangeListView caching behavior."""
 
     def setUp(self):
@@ -200,7 +213,7 @@ class ExchangeListViewCacheTest(APITestCase):
         self.assertEqual(response2_cached.data, filtered_exchanges)
 
 
-class SectorListViewCacheTest(APITestCase):
+class SectorListViewCacheTest(APITransactionTestCase):
     """Tests for SectorListView caching behavior."""
 
     def setUp(self):
@@ -432,7 +445,7 @@ class SectorListViewCacheTest(APITestCase):
         self.assertEqual(response2.status_code, status.HTTP_200_OK)
 
 
-class TickerListViewCacheTest(APITestCase):
+class TickerListViewCacheTest(APITransactionTestCase):
     """Tests for TickerListView caching behavior."""
 
     def setUp(self):
@@ -643,7 +656,7 @@ class TickerListViewCacheTest(APITestCase):
         self.assertEqual(response2.data, response1.data)
 
 
-class CacheInvalidationUtilityTest(APITestCase):
+class CacheInvalidationUtilityTest(APITransactionTestCase):
     """Tests for cache invalidation utility functions."""
 
     def setUp(self):
@@ -712,6 +725,56 @@ class CacheInvalidationUtilityTest(APITestCase):
         tickers = [item['ticker'] for item in response3.data['results']]
         self.assertIn('GOOGL', tickers)
 
+    def test_cache_keys_include_view_version(self):
+        """Test that cached pages are keyed under the view's current version."""
+        redis_client = cache._cache.get_client()
+        Exchange.objects.create(name='NASDAQ')
+        url = reverse('api:exchange-list')
+        
+        version = get_list_view_cache_version('api:exchange-list')
+        
+        self.client.get(url)
+        self.assertTrue(redis_client.keys(f'*.cache_page.api:exchange-list:v{version}.GET.*'))
+        
+        invalidate_list_view_cache('api:exchange-list')
+        self.client.get(url)
+        self.assertTrue(redis_client.keys(f'*.cache_page.api:exchange-list:v{version + 1}.GET.*'))
+
+    def test_invalidate_list_view_cache_bumps_version(self):
+        """Test that invalidation increments only the invalidated view's version."""
+        self.assertEqual(get_list_view_cache_version('api:exchange-list'), 0)
+        
+        invalidate_list_view_cache('api:exchange-list')
+        invalidate_list_view_cache('api:exchange-list')
+        
+        self.assertEqual(get_list_view_cache_version('api:exchange-list'), 2)
+        self.assertEqual(get_list_view_cache_version('api:ticker-list'), 0)
+
+    def test_cache_bypassed_when_version_unavailable(self):
+        """Test that requests skip the cache if the view version can't be read."""
+        Exchange.objects.create(name='NASDAQ')
+        url = reverse('api:exchange-list')
+        
+        with patch('api.cache_utils.get_list_view_cache_version', return_value=None):
+            response1 = self.client.get(url)
+            # Created without signals, so only an uncached request can see it
+            Exchange.objects.bulk_create([Exchange(name='NYSE')])
+            response2 = self.client.get(url)
+        
+        self.assertEqual(len(response1.data['results']), 1)
+        self.assertEqual(len(response2.data['results']), 2)
+
+    def test_redis_client_reused_across_calls(self):
+        """Test that cache utilities reuse one Redis client per connection pool."""
+        with patch.object(cache._cache, '_client', wraps=cache._cache._client) as mock_client:
+            _redis_clients.clear()
+            invalidate_list_view_cache('api:exchange-list')
+            invalidate_list_view_cache('api:exchange-list')
+            get_list_view_cache_version('api:exchange-list')
+        
+        self.assertEqual(mock_client.call_count, 1)
+        self.assertEqual(get_list_view_cache_version('api:exchange-list'), 2)
+
     def test_invalidate_list_view_cache_handles_unknown_backend(self):
         """Test that invalidate_list_view_cache handles unknown cache backends gracefully."""
         # Mock cache backend without get_client method
@@ -726,7 +789,7 @@ class CacheInvalidationUtilityTest(APITestCase):
                 self.fail(f"invalidate_list_view_cache raised {type(e).__name__}: {e}")
 
 
-class CacheInvalidationSignalsTest(APITestCase):
+class CacheInvalidationSignalsTest(APITransactionTestCase):
     """Tests for Django signal-based cache invalidation."""
 
     def setUp(self):
@@ -887,3 +950,163 @@ class CacheInvalidationSignalsTest(APITestCase):
         # Verify responses are different (cache was invalidated)
         self.assertNotEqual(sector_response2.data, sector_response1.data)
 
+
+class ScheduleListViewCacheInvalidationTest(APITestCase):
+    """Tests for schedule_list_view_cache_invalidation."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        patcher = patch('api.cache_utils.invalidate_list_view_cache')
+        self.mock_invalidate = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_invalidates_on_commit(self):
+        """Test that the cache is only invalidated when the transaction commits."""
+        with self.captureOnCommitCallbacks(execute=True):
+            schedule_list_view_cache_invalidation('api:ticker-list')
+            self.mock_invalidate.assert_not_called()
+        
+        self.mock_invalidate.assert_called_once_with('api:ticker-list')
+
+    def test_deduplicates_per_view_within_transaction(self):
+        """Test that many changes in one transaction invalidate each view once."""
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            for i in range(10):
+                Stock.objects.create(ticker=f'TICK{i}')
+            Exchange.objects.create(name='NASDAQ')
+        
+        self.assertEqual(len(callbacks), 2)
+        invalidated_views = sorted(call.args[0] for call in self.mock_invalidate.call_args_list)
+        self.assertEqual(invalidated_views, ['api:exchange-list', 'api:ticker-list'])
+
+    def test_rolled_back_savepoint_does_not_suppress_later_schedule(self):
+        """Test that a view scheduled inside a rolled back savepoint can be scheduled again."""
+        with self.captureOnCommitCallbacks(execute=True):
+            try:
+                with transaction.atomic():
+                    schedule_list_view_cache_invalidation('api:ticker-list')
+                    raise RuntimeError('rollback')
+            except RuntimeError:
+                pass
+            schedule_list_view_cache_invalidation('api:ticker-list')
+        
+        self.mock_invalidate.assert_called_once_with('api:ticker-list')
+
+    def test_rolled_back_transaction_does_not_invalidate(self):
+        """Test that changes rolled back never invalidate the cache."""
+        with self.captureOnCommitCallbacks(execute=True):
+            try:
+                with transaction.atomic():
+                    Stock.objects.create(ticker='ROLLBACK')
+                    raise RuntimeError('rollback')
+            except RuntimeError:
+                pass
+        
+        self.mock_invalidate.assert_not_called()
+
+
+class LatestDoneRunCacheTest(APITransactionTestCase):
+    """Tests for the read-through cache behind get_latest_done_run()."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        cache.clear()
+        self.stock = Stock.objects.create(ticker='AAPL')
+
+    def _create_done_run(self, uri):
+        return StockIngestionRun.objects.create(
+            stock=self.stock,
+            state=IngestionState.DONE,
+            raw_data_uri=uri,
+        )
+
+    def test_cache_hit_skips_database(self):
+        """Test that the latest DONE run is served from the cache after the first lookup."""
+        run = self._create_done_run('s3://bucket/AAPL/1.json')
+        
+        first = StockIngestionRun.objects.get_latest_done_run(self.stock)
+        with CaptureQueriesContext(connection) as queries:
+            second = StockIngestionRun.objects.get_latest_done_run(self.stock)
+        
+        self.assertEqual(len(queries), 0)
+        self.assertEqual(first, run)
+        self.assertEqual(second, run)
+        self.assertEqual(second.raw_data_uri, 's3://bucket/AAPL/1.json')
+        self.assertEqual(second.created_at, run.created_at)
+        self.assertTrue(second.terminal)
+        self.assertIs(second.stock, self.stock)
+        self.assertFalse(second._state.adding)
+
+    def test_stock_without_done_run_not_cached(self):
+        """Test that a missing DONE run isn't cached."""
+        self.assertIsNone(StockIngestionRun.objects.get_latest_done_run(self.stock))
+        self.assertIsNone(cache.get(get_latest_done_run_cache_key(self.stock.id)))
+        
+        run = self._create_done_run('s3://bucket/AAPL/1.json')
+        
+        self.assertEqual(StockIngestionRun.objects.get_latest_done_run(self.stock), run)
+
+    def test_new_done_run_invalidates_cache(self):
+        """Test that saving a newer DONE run drops the cached one."""
+        self._create_done_run('s3://bucket/AAPL/old.json')
+        StockIngestionRun.objects.get_latest_done_run(self.stock)
+        
+        newer = self._create_done_run('s3://bucket/AAPL/new.json')
+        
+        self.assertEqual(StockIngestionRun.objects.get_latest_done_run(self.stock), newer)
+
+    def test_deleted_done_run_invalidates_cache(self):
+        """Test that deleting the cached DONE run falls back to the previous one."""
+        older = self._create_done_run('s3://bucket/AAPL/old.json')
+        newer = self._create_done_run('s3://bucket/AAPL/new.json')
+        StockIngestionRun.objects.get_latest_done_run(self.stock)
+        
+        newer.delete()
+        
+        self.assertEqual(StockIngestionRun.objects.get_latest_done_run(self.stock), older)
+
+    def test_other_states_do_not_invalidate_cache(self):
+        """Test that saving runs in other states keeps the cached DONE run."""
+        self._create_done_run('s3://bucket/AAPL/1.json')
+        StockIngestionRun.objects.get_latest_done_run(self.stock)
+        
+        StockIngestionRun.objects.create(stock=self.stock, state=IngestionState.FETCHING)
+        
+        self.assertIsNotNone(cache.get(get_latest_done_run_cache_key(self.stock.id)))
+
+    def test_invalidation_waits_for_commit(self):
+        """Test that the cached run is only dropped once the transaction commits."""
+        self._create_done_run('s3://bucket/AAPL/old.json')
+        StockIngestionRun.objects.get_latest_done_run(self.stock)
+        cache_key = get_latest_done_run_cache_key(self.stock.id)
+        
+        with transaction.atomic():
+            self._create_done_run('s3://bucket/AAPL/new.json')
+            self.assertIsNotNone(cache.get(cache_key))
+        
+        self.assertIsNone(cache.get(cache_key))
+
+    def test_invalidations_in_one_transaction_are_coalesced(self):
+        """Test that DONE runs saved in one transaction drop their stocks' cached runs in one call."""
+        other_stock = Stock.objects.create(ticker='MSFT')
+        
+        with patch.object(cache, 'delete_many') as mock_delete_many:
+            with transaction.atomic():
+                self._create_done_run('s3://bucket/AAPL/1.json')
+                self._create_done_run('s3://bucket/AAPL/2.json')
+                StockIngestionRun.objects.create(stock=other_stock, state=IngestionState.DONE)
+                mock_delete_many.assert_not_called()
+        
+        mock_delete_many.assert_called_once()
+        self.assertCountEqual(
+            mock_delete_many.call_args.args[0],
+            [get_latest_done_run_cache_key(self.stock.id), get_latest_done_run_cache_key(other_stock.id)]
+        )
+
+    def test_cache_failure_falls_back_to_database(self):
+        """Test that the run is read from the database when the cache is unavailable."""
+        run = self._create_done_run('s3://bucket/AAPL/1.json')
+        
+        with patch.object(cache, 'get', side_effect=ConnectionError('redis unavailable')), \
+                patch.object(cache, 'set', side_effect=ConnectionError('redis unavailable')):
+            self.assertEqual(StockIngestionRun.objects.get_latest_done_run(self.stock), run)
@@ -6,14 +6,19 @@ This test module covers:
 """
 
 from datetime import timedelta
+from unittest.mock import patch
 
 from django.contrib.auth import get_user_model
+from django.db.models import QuerySet
 from django.urls import reverse
 from django.utils import timezone
 from rest_framework import status
-from rest_framework.test import APITestCase
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory, APITestCase
 
+from api.filters import QueryParamFilterBackend, StockIngestionRunFilter, get_trimmed_filterset_class
 from api.models import BulkQueueRun, Exchange, IngestionState, Sector, Stock, StockIngestionRun
+from api.views.list_views import RunListView
 
 User = get_user_model()
 
@@ -506,6 +511,74 @@ class RunListFilterAPITest(APITestCase):
         # Should return run1 and run2 (DONE/FAILED)
         self.assertEqual(len(response.data['results']), 2)
 
+    def test_filter_state_and_is_terminal_combined(self):
+        """Test that state and is_terminal constrain the state together."""
+        url = reverse('api:run-list')
+        response = self.client.get(url, {'state': 'FAILED', 'is_terminal': 'true'})
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([run['state'] for run in response.data['results']], ['FAILED'])
+        
+        # Contradictory state filters match nothing
+        response = self.client.get(url, {'state': 'FAILED', 'is_in_progress': 'true'})
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['results']), 0)
+
+    def test_filter_by_state_in(self):
+        """Test filtering runs by a comma-separated list of states."""
+        url = reverse('api:run-list')
+        response = self.client.get(url, {'state__in': 'DONE,FETCHING'})
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        states = sorted(run['state'] for run in response.data['results'])
+        self.assertEqual(states, ['DONE', 'FETCHING'])
+
+    def test_filter_by_state_in_invalid_choice(self):
+        """Test that unknown states in state__in are rejected."""
+        url = reverse('api:run-list')
+        response = self.client.get(url, {'state__in': 'DONE,NOT_A_STATE'})
+        
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_is_in_progress_uses_terminal_column(self):
+        """Test that is_in_progress compiles to a test of the terminal column matching idx_active_runs."""
+        filterset = StockIngestionRunFilter(
+            data={'is_in_progress': 'true'},
+            queryset=StockIngestionRun.objects.all(),
+        )
+        
+        sql = str(filterset.qs.query)
+        
+        self.assertIn('NOT "stock_ingestion_runs"."terminal"', sql)
+
+    def test_is_in_progress_filter_on_its_own(self):
+        """Test that the is_in_progress filter matches its name without filter_queryset()'s merging."""
+        is_in_progress = StockIngestionRunFilter.base_filters['is_in_progress']
+        runs = StockIngestionRun.objects.all()
+        
+        for run in is_in_progress.filter(runs, True):
+            self.assertFalse(run.is_terminal)
+        for run in is_in_progress.filter(runs, False):
+            self.assertTrue(run.is_terminal)
+        self.assertEqual(
+            is_in_progress.filter(runs, True).count() + is_in_progress.filter(runs, False).count(),
+            runs.count()
+        )
+
+    def test_state_filters_applied_in_single_filter_call(self):
+        """Test that the state filters are merged into one filter() call."""
+        filterset = StockIngestionRunFilter(
+            data={'state': 'FAILED', 'is_terminal': 'true', 'is_in_progress': 'false'},
+            queryset=StockIngestionRun.objects.all(),
+        )
+        
+        with patch.object(QuerySet, 'filter', autospec=True, side_effect=QuerySet.filter) as mock_filter:
+            runs = list(filterset.qs)
+        
+        self.assertEqual(mock_filter.call_count, 1)
+        self.assertEqual([run.state for run in runs], [IngestionState.FAILED])
+
     def test_filter_multiple_parameters(self):
         """Test filtering with multiple parameters combined."""
         url = reverse('api:run-list')
@@ -1128,3 +1201,80 @@ class BulkQueueRunListFilterAPITest(APITestCase):
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(len(response.data['results']), 2)
+
+
+class QueryParamFilterBackendTest(APITestCase):
+    """Tests for building only the filters a list request asks for."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123'
+        )
+        self.client.force_authenticate(user=self.user)
+        
+        stock = Stock.objects.create(ticker='AAPL')
+        StockIngestionRun.objects.create(stock=stock, state=IngestionState.DONE)
+        StockIngestionRun.objects.create(stock=stock, state=IngestionState.FETCHING)
+        self.url = reverse('api:run-list')
+
+    def test_filterset_not_built_without_query_params(self):
+        """Test that a plain list request doesn't instantiate the FilterSet."""
+        with patch.object(StockIngestionRunFilter, '__init__', side_effect=AssertionError('FilterSet built')):
+            response = self.client.get(self.url)
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['results']), 2)
+
+    def test_filterset_not_built_for_pagination_params(self):
+        """Test that pagination-only query parameters don't instantiate the FilterSet."""
+        with patch.object(StockIngestionRunFilter, '__init__', side_effect=AssertionError('FilterSet built')):
+            response = self.client.get(self.url, {'page_size': 1})
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['results']), 1)
+
+    def test_filterset_applied_with_filter_param(self):
+        """Test that a filter parameter still filters (and validates) the queryset."""
+        response = self.client.get(self.url, {'state': IngestionState.DONE, 'page_size': 10})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['results']), 1)
+        
+        response = self.client.get(self.url, {'state': 'NOT_A_STATE'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_filterset_built_with_requested_filters_only(self):
+        """Test that the queryset is filtered by a FilterSet containing only the requested filters."""
+        view = RunListView()
+        request = Request(APIRequestFactory().get(self.url, {'state': IngestionState.DONE, 'page_size': 10}))
+        
+        with patch('api.filters.get_trimmed_filterset_class', wraps=get_trimmed_filterset_class) as mock_trim:
+            queryset = QueryParamFilterBackend().filter_queryset(request, view.get_queryset(), view)
+        
+        mock_trim.assert_called_once_with(StockIngestionRunFilter, frozenset({'state'}))
+        self.assertEqual(queryset.count(), 1)
+
+    def test_filter_form_shows_all_filters(self):
+        """Test that the browsable API's filter form isn't trimmed to the requested filters."""
+        view = RunListView()
+        request = Request(APIRequestFactory().get(self.url))
+        
+        filterset = QueryParamFilterBackend().get_filterset(request, view.get_queryset(), view)
+        
+        self.assertEqual(set(filterset.filters), set(StockIngestionRunFilter.base_filters))
+        html = QueryParamFilterBackend().to_html(request, view.get_queryset(), view)
+        self.assertIn('name="is_terminal"', html)
+
+    def test_trimmed_filterset_class_is_reused(self):
+        """Test that trimmed FilterSet subclasses are built once per combination of filters."""
+        first = get_trimmed_filterset_class(StockIngestionRunFilter, frozenset({'state', 'ticker'}))
+        second = get_trimmed_filterset_class(StockIngestionRunFilter, frozenset({'ticker', 'state'}))
+        other = get_trimmed_filterset_class(StockIngestionRunFilter, frozenset({'state'}))
+        
+        self.assertIs(first, second)
+        self.assertIsNot(first, other)
+        self.assertEqual(set(first.base_filters), {'state', 'ticker'})
+        # The declared FilterSet itself is left untouched
+        self.assertIn('is_terminal', StockIngestionRunFilter.base_filters)
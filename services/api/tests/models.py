@@ -6,11 +6,22 @@ This file contains unit tests for:
 - StockIngestionRun model: state and timestamp behaviors, related stock usage, and custom manager methods.
 """
 
+import time
 
 from django.test import TestCase
-from django.db import IntegrityError
+from django.db import IntegrityError, connection
+from django.test.utils import CaptureQueriesContext
 
-from api.models import BulkQueueRun, Exchange, IngestionState, Sector, Stock, StockIngestionRun
+from api.models import (
+    ACTIVE_INGESTION_STATES,
+    TERMINAL_INGESTION_STATES,
+    BulkQueueRun,
+    Exchange,
+    IngestionState,
+    Sector,
+    Stock,
+    StockIngestionRun,
+)
 
 
 class ExchangeModelTest(TestCase):
@@ -99,6 +110,12 @@ class ExchangeModelTest(TestCase):
         self.assertEqual(exchange.id, existing_exchange.id)
         self.assertEqual(exchange.name, 'NASDAQ')
 
+    def test_exchange_name_normalized_by_database_on_bulk_writes(self):
+        """Test that exchange names written without save() are normalized by the database."""
+        Exchange.objects.bulk_create([Exchange(name=' nyse ')])
+        
+        self.assertTrue(Exchange.objects.filter(name='NYSE').exists())
+
     def test_exchange_get_or_create_with_normalization(self):
         """Test that get_or_create works when name is normalized before calling it."""
         # Create exchange with uppercase
@@ -285,6 +302,33 @@ class StockModelTest(TestCase):
         # Verify it's stored as uppercase and trimmed
         self.assertEqual(stock.ticker, 'AAPL')
 
+    def test_save_with_update_fields_skips_ticker_normalization(self):
+        """Test that saving other fields with update_fields leaves the ticker alone."""
+        stock = Stock.objects.create(ticker='AAPL')
+        stock.ticker = 'aapl'
+        stock.name = 'Apple Inc.'
+        
+        stock.save(update_fields=['name'])
+        
+        self.assertEqual(stock.ticker, 'aapl')
+        stock.refresh_from_db()
+        self.assertEqual(stock.ticker, 'AAPL')
+        self.assertEqual(stock.name, 'Apple Inc.')
+        
+        stock.ticker = ' msft '
+        stock.save(update_fields=['ticker'])
+        self.assertEqual(stock.ticker, 'MSFT')
+
+    def test_ticker_normalized_by_database_on_bulk_writes(self):
+        """Test that tickers written without save() are normalized by the database."""
+        Stock.objects.bulk_create([Stock(ticker=' msft\t'), Stock(ticker='goog')])
+        Stock.objects.filter(ticker='GOOG').update(ticker='googl ')
+        
+        self.assertEqual(
+            list(Stock.objects.order_by('ticker').values_list('ticker', flat=True)),
+            ['GOOGL', 'MSFT']
+        )
+
     def test_stock_str_representation(self):
         """Test the string representation of a stock."""
         stock = Stock.objects.create(ticker='GOOGL')
@@ -296,6 +340,77 @@ class StockModelTest(TestCase):
         self.assertIn('MSFT', repr(stock))
 
 
+class StockLatestRunTest(TestCase):
+    """Tests for the latest run state denormalized onto Stock by the database."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.stock = Stock.objects.create(ticker='AAPL')
+
+    def test_no_runs(self):
+        """Test that a stock without runs has no latest run state."""
+        self.stock.refresh_from_db()
+        
+        self.assertIsNone(self.stock.latest_run_state)
+        self.assertIsNone(self.stock.latest_run_at)
+
+    def test_follows_latest_run(self):
+        """Test that creating and updating the latest run updates the stock."""
+        run = StockIngestionRun.objects.create(stock=self.stock)
+        self.stock.refresh_from_db()
+        self.assertEqual(self.stock.latest_run_state, IngestionState.QUEUED_FOR_FETCH)
+        self.assertEqual(self.stock.latest_run_at, run.created_at)
+        
+        StockIngestionRun.objects.filter(pk=run.pk).update(state=IngestionState.FETCHING)
+        self.stock.refresh_from_db()
+        self.assertEqual(self.stock.latest_run_state, IngestionState.FETCHING)
+
+    def test_older_run_updates_ignored(self):
+        """Test that updates to a run older than the latest one don't change the stock."""
+        old_run = StockIngestionRun.objects.create(stock=self.stock, state=IngestionState.FETCHING)
+        # Only a terminal run can be newer than an active one
+        StockIngestionRun.objects.create(stock=self.stock, state=IngestionState.FAILED)
+        
+        StockIngestionRun.objects.filter(pk=old_run.pk).update(state=IngestionState.FETCHED)
+        self.stock.refresh_from_db()
+        
+        self.assertEqual(self.stock.latest_run_state, IngestionState.FAILED)
+
+    def test_deleting_latest_run_falls_back_to_previous_run(self):
+        """Test that deleting the latest run restores the previous run's state."""
+        StockIngestionRun.objects.create(stock=self.stock, state=IngestionState.DONE)
+        latest_run = StockIngestionRun.objects.create(stock=self.stock, state=IngestionState.FETCHING)
+        
+        latest_run.delete()
+        self.stock.refresh_from_db()
+        self.assertEqual(self.stock.latest_run_state, IngestionState.DONE)
+        
+        StockIngestionRun.objects.all().delete()
+        self.stock.refresh_from_db()
+        self.assertIsNone(self.stock.latest_run_state)
+        self.assertIsNone(self.stock.latest_run_at)
+
+    def test_latest_run_state_changes_keep_updated_at(self):
+        """Test that keeping the latest run state in sync doesn't count as modifying the stock."""
+        updated_at = Stock.objects.get(pk=self.stock.pk).updated_at
+        
+        StockIngestionRun.objects.create(stock=self.stock)
+        
+        self.assertEqual(Stock.objects.get(pk=self.stock.pk).updated_at, updated_at)
+
+    def test_saving_stale_stock_keeps_latest_run_state(self):
+        """Test that saving a stock loaded before its latest run changed doesn't overwrite the state."""
+        stale_stock = Stock.objects.get(pk=self.stock.pk)
+        StockIngestionRun.objects.create(stock=self.stock, state=IngestionState.FETCHING)
+        
+        stale_stock.name = 'Apple Inc.'
+        stale_stock.save()
+        self.stock.refresh_from_db()
+        
+        self.assertEqual(self.stock.name, 'Apple Inc.')
+        self.assertEqual(self.stock.latest_run_state, IngestionState.FETCHING)
+
+
 class StockSectorForeignKeyTest(TestCase):
     """Tests for the Stock.sector ForeignKey relationship."""
 
@@ -564,6 +679,17 @@ class StockIngestionRunModelTest(TestCase):
         self.assertIsNone(run.requested_by)
         self.assertIsNone(run.request_id)
 
+    def test_is_terminal_matches_state_sets(self):
+        """Test that every state is either terminal or active, matching is_terminal."""
+        self.assertEqual(TERMINAL_INGESTION_STATES | set(ACTIVE_INGESTION_STATES), set(IngestionState))
+        self.assertFalse(TERMINAL_INGESTION_STATES & set(ACTIVE_INGESTION_STATES))
+        
+        run = StockIngestionRun(stock=self.stock)
+        for state in IngestionState:
+            run.state = state
+            self.assertEqual(run.is_terminal, state in TERMINAL_INGESTION_STATES)
+            self.assertEqual(run.is_in_progress, state in ACTIVE_INGESTION_STATES)
+
     def test_is_terminal_for_done_state(self):
         """Test is_terminal property for DONE state."""
         run = StockIngestionRun.objects.create(
@@ -603,6 +729,47 @@ class StockIngestionRunModelTest(TestCase):
             self.assertTrue(run.is_in_progress, f"State {state} should be in progress")
             self.assertFalse(run.is_terminal, f"State {state} should not be terminal")
 
+    def test_run_ids_are_time_ordered(self):
+        """Test that run IDs are version 7 UUIDs ordered by creation time."""
+        first_run = StockIngestionRun.objects.create(stock=self.stock, state=IngestionState.DONE)
+        time.sleep(0.002)
+        second_run = StockIngestionRun.objects.create(stock=self.stock)
+        
+        self.assertEqual(first_run.id.version, 7)
+        self.assertLess(first_run.id, second_run.id)
+
+    def test_updated_at_set_by_queryset_update(self):
+        """Test that the database sets updated_at on updates that bypass save()."""
+        run = StockIngestionRun.objects.create(stock=self.stock)
+        
+        StockIngestionRun.objects.filter(pk=run.pk).update(state=IngestionState.FETCHING)
+        updated_run = StockIngestionRun.objects.get(pk=run.pk)
+        
+        self.assertGreater(updated_run.updated_at, run.updated_at)
+
+    def test_updated_at_set_by_save_is_kept(self):
+        """Test that the updated_at written by save() is the one stored."""
+        run = StockIngestionRun.objects.create(stock=self.stock)
+        
+        run.state = IngestionState.FETCHING
+        run.save()
+        
+        self.assertEqual(StockIngestionRun.objects.get(pk=run.pk).updated_at, run.updated_at)
+
+    def test_terminal_column_follows_state(self):
+        """Test that the generated terminal column is recomputed when the state changes."""
+        run = StockIngestionRun.objects.create(stock=self.stock)
+        run.refresh_from_db()
+        self.assertFalse(run.terminal)
+
+        StockIngestionRun.objects.filter(pk=run.pk).update(state=IngestionState.FETCHING)
+        self.assertFalse(StockIngestionRun.objects.get(pk=run.pk).terminal)
+
+        run.state = IngestionState.FAILED
+        run.save()
+        run.refresh_from_db()
+        self.assertTrue(run.terminal)
+
     def test_run_str_representation(self):
         """Test the string representation of a run."""
         run = StockIngestionRun.objects.create(stock=self.stock)
@@ -611,6 +778,25 @@ class StockIngestionRunModelTest(TestCase):
         self.assertIn('AAPL', str_repr)
         self.assertIn('QUEUED_FOR_FETCH', str_repr)
 
+    def test_run_str_does_not_fetch_stock(self):
+        """Test that formatting a run loaded without its stock doesn't query the stock."""
+        run = StockIngestionRun.objects.create(stock=self.stock)
+        loaded_run = StockIngestionRun.objects.get(pk=run.pk)
+
+        with self.assertNumQueries(0):
+            self.assertIn(str(self.stock.id), str(loaded_run))
+            self.assertIn(str(self.stock.id), repr(loaded_run))
+
+    def test_run_str_uses_loaded_stock(self):
+        """Test that runs loaded with their stock are formatted with the ticker without extra queries."""
+        StockIngestionRun.objects.create(stock=self.stock)
+
+        with self.assertNumQueries(1):
+            labels = [str(run) for run in StockIngestionRun.objects.select_related('stock')]
+
+        self.assertEqual(len(labels), 1)
+        self.assertIn('AAPL', labels[0])
+
     def test_unique_constraint_prevents_multiple_active_runs(self):
         """Test that the unique constraint prevents multiple active runs for the same stock."""
         
@@ -669,7 +855,7 @@ class StockIngestionRunModelTest(TestCase):
         )
         
         # Transition to terminal state
-        run.state = IngestionState.DONE
+        run.state = IngestionState.FAILED
         run.save()
         
         # Should now be able to create a new active run
@@ -727,6 +913,24 @@ class StockIngestionRunManagerTest(TestCase):
             latest = StockIngestionRun.objects.get_latest_by_ticker(ticker)
             self.assertEqual(latest.id, run.id)
 
+    def test_get_latest_by_ticker_filters_on_stock_id(self):
+        """Test that get_latest_by_ticker filters runs on stock_id instead of the joined ticker."""
+        StockIngestionRun.objects.create(stock=self.stock)
+        
+        with CaptureQueriesContext(connection) as ctx:
+            StockIngestionRun.objects.get_latest_by_ticker('AAPL')
+        
+        self.assertEqual(len(ctx.captured_queries), 1)
+        sql = ctx.captured_queries[0]['sql']
+        self.assertIn('WHERE "stock_ingestion_runs"."stock_id" = (SELECT', sql)
+        self.assertNotIn('"stocks"."ticker" =', sql)
+
+    def test_get_latest_by_ticker_unknown_ticker(self):
+        """Test that get_latest_by_ticker returns None for an unknown ticker."""
+        StockIngestionRun.objects.create(stock=self.stock)
+        
+        self.assertIsNone(StockIngestionRun.objects.get_latest_by_ticker('UNKNOWN'))
+
     def test_get_active_runs(self):
         """Test getting all active (non-terminal) runs."""
         # Create terminal runs
@@ -750,6 +954,51 @@ class StockIngestionRunManagerTest(TestCase):
         self.assertEqual(active_runs.count(), 1)
         self.assertEqual(active_runs.first().id, active_run.id)
 
+    def test_bulk_create_queued(self):
+        """Test creating queued runs in bulk, skipping stocks with an active run."""
+        msft = Stock.objects.create(ticker='MSFT')
+        googl = Stock.objects.create(ticker='GOOGL')
+        active_run = StockIngestionRun.objects.create(stock=msft, state=IngestionState.FETCHING)
+        bulk_run = BulkQueueRun.objects.create(total_stocks=3)
+        
+        runs = StockIngestionRun.objects.bulk_create_queued(
+            [self.stock, msft, googl],
+            bulk_queue_run=bulk_run,
+            requested_by='test-user',
+            request_id='bulk-request',
+        )
+        
+        self.assertEqual([run.stock.ticker for run in runs], ['AAPL', 'GOOGL'])
+        for run in StockIngestionRun.objects.filter(id__in=[run.id for run in runs]):
+            self.assertEqual(run.state, IngestionState.QUEUED_FOR_FETCH)
+            self.assertEqual(run.bulk_queue_run_id, bulk_run.id)
+            self.assertEqual(run.requested_by, 'test-user')
+            self.assertEqual(run.request_id, 'bulk-request')
+            self.assertEqual(run.queued_for_fetch_at, run.created_at)
+        
+        # The existing active run is untouched
+        self.assertEqual(StockIngestionRun.objects.filter(stock=msft).get().id, active_run.id)
+
+    def test_bulk_create_queued_single_statement(self):
+        """Test that runs are created, skipping stocks with an active run, in one INSERT ... SELECT."""
+        msft = Stock.objects.create(ticker='MSFT')
+        StockIngestionRun.objects.create(stock=msft, state=IngestionState.FETCHING)
+        
+        with CaptureQueriesContext(connection) as ctx:
+            runs = StockIngestionRun.objects.bulk_create_queued(
+                [self.stock, msft],
+                requested_by='test-user',
+            )
+        
+        self.assertEqual(len(ctx.captured_queries), 1)
+        self.assertIn('NOT EXISTS', ctx.captured_queries[0]['sql'])
+        self.assertEqual([run.stock_id for run in runs], [self.stock.id])
+        run = StockIngestionRun.objects.get(id=runs[0].id)
+        self.assertEqual(run.requested_by, 'test-user')
+        self.assertIsNone(run.request_id)
+        self.assertIsNone(run.bulk_queue_run_id)
+        self.assertEqual(run.created_at, runs[0].created_at)
+
 
 class BulkQueueRunModelTest(TestCase):
     """Tests for the BulkQueueRun model."""
@@ -827,6 +1076,26 @@ class BulkQueueRunModelTest(TestCase):
         self.assertEqual(bulk_run.skipped_count, 15)
         self.assertEqual(bulk_run.error_count, 5)
 
+    def test_increment_counters(self):
+        """Test that increment adds to the counters in a single UPDATE."""
+        bulk_run = BulkQueueRun.objects.create(total_stocks=10, queued_count=2)
+        
+        with self.assertNumQueries(1):
+            bulk_run.increment(queued=3, skipped=1, errors=2)
+        bulk_run.increment(queued=1)
+        
+        bulk_run.refresh_from_db()
+        self.assertEqual(bulk_run.queued_count, 6)
+        self.assertEqual(bulk_run.skipped_count, 1)
+        self.assertEqual(bulk_run.error_count, 2)
+
+    def test_increment_nothing_skips_query(self):
+        """Test that increment without counts doesn't query the database."""
+        bulk_run = BulkQueueRun.objects.create(total_stocks=10)
+        
+        with self.assertNumQueries(0):
+            bulk_run.increment()
+
 
 class BulkQueueRunRelationshipTest(TestCase):
     """Tests for the BulkQueueRun foreign key relationship with StockIngestionRun."""
@@ -951,3 +1220,29 @@ class BulkQueueRunRelationshipTest(TestCase):
         self.assertIn('MSFT', failed_tickers)
         self.assertNotIn('GOOGL', failed_tickers)
         self.assertNotIn('TSLA', failed_tickers)
+
+    def test_get_ingestion_run_stats_counts_each_run_in_one_query(self):
+        """Test that stats of several bulk queue runs are counted in a single query."""
+        other_bulk_run = BulkQueueRun.objects.create(total_stocks=5)
+        empty_bulk_run = BulkQueueRun.objects.create(total_stocks=0)
+        stocks = [Stock.objects.create(ticker=f'TICK{i}') for i in range(3)]
+        StockIngestionRun.objects.create(stock=self.stock, bulk_queue_run=self.bulk_run, state=IngestionState.DONE)
+        StockIngestionRun.objects.create(stock=stocks[0], bulk_queue_run=self.bulk_run, state=IngestionState.DONE)
+        StockIngestionRun.objects.create(stock=stocks[1], bulk_queue_run=self.bulk_run, state=IngestionState.FETCHING)
+        StockIngestionRun.objects.create(stock=stocks[2], bulk_queue_run=other_bulk_run, state=IngestionState.FAILED)
+        
+        with self.assertNumQueries(1):
+            stats = BulkQueueRun.objects.get_ingestion_run_stats(
+                [self.bulk_run.id, other_bulk_run.id, empty_bulk_run.id]
+            )
+        
+        self.assertEqual(stats[self.bulk_run.id]['total'], 3)
+        self.assertEqual(stats[self.bulk_run.id]['by_state'][IngestionState.DONE], 2)
+        self.assertEqual(stats[self.bulk_run.id]['by_state'][IngestionState.FETCHING], 1)
+        self.assertEqual(stats[self.bulk_run.id]['by_state'][IngestionState.FAILED], 0)
+        self.assertEqual(stats[other_bulk_run.id]['total'], 1)
+        self.assertEqual(stats[other_bulk_run.id]['by_state'][IngestionState.FAILED], 1)
+        self.assertEqual(stats[empty_bulk_run.id], {
+            'total': 0,
+            'by_state': {state: 0 for state in IngestionState.values},
+        })
@@ -0,0 +1,97 @@
+"""
+Tests for API serializers.
+
+This test module covers:
+- Per-class caching of serializer fields (CachedFieldsMixin), including
+  request serializers
+"""
+
+from unittest.mock import patch
+
+from django.test import TestCase
+from rest_framework import serializers
+
+from api.models import IngestionState, Stock, StockIngestionRun
+from api.serializers import (
+    QueueForFetchRequestSerializer,
+    StockIngestionRunSerializer,
+    StockLatestRunSerializer,
+    StockSerializer,
+)
+
+
+class CachedFieldsMixinTest(TestCase):
+    """Tests for serializers building their fields once per class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.stock = Stock.objects.create(ticker='AAPL', name='Apple Inc.')
+
+    def test_fields_built_once_per_class(self):
+        """Test that the model isn't introspected again for later instances."""
+        StockSerializer().fields
+        
+        with patch.object(serializers.ModelSerializer, 'get_fields') as mock_get_fields:
+            fields = StockSerializer().fields
+        
+        mock_get_fields.assert_not_called()
+        self.assertIn('exchange_name', fields)
+
+    def test_instances_bind_their_own_fields(self):
+        """Test that each instance binds copies, leaving the cached fields unbound."""
+        first = StockSerializer(self.stock)
+        second = StockSerializer(self.stock)
+        
+        self.assertIsNot(first.fields['ticker'], second.fields['ticker'])
+        self.assertIs(first.fields['ticker'].parent, first)
+        self.assertIs(second.fields['ticker'].parent, second)
+        self.assertIsNone(StockSerializer._cached_fields['ticker'].parent)
+
+    def test_subclass_caches_its_own_fields(self):
+        """Test that a subclass declaring more fields doesn't reuse its parent's cache."""
+        class ExtendedStockSerializer(StockSerializer):
+            extra = serializers.SerializerMethodField()
+
+            class Meta(StockSerializer.Meta):
+                fields = StockSerializer.Meta.fields + ['extra']
+
+            def get_extra(self, obj):
+                return 'extra'
+        
+        StockSerializer().fields
+        
+        self.assertEqual(ExtendedStockSerializer(self.stock).data['extra'], 'extra')
+        self.assertNotIn('extra', StockSerializer().fields)
+
+    def test_output_unchanged_across_instances(self):
+        """Test that serializing repeatedly gives the same data."""
+        run = StockIngestionRun.objects.create(stock=self.stock, state=IngestionState.FETCHING)
+        
+        first = StockIngestionRunSerializer(run).data
+        second = StockIngestionRunSerializer(run).data
+        
+        self.assertEqual(first, second)
+        self.assertEqual(second['ticker'], 'AAPL')
+        self.assertTrue(second['is_in_progress'])
+
+    def test_nested_serializer_fields_not_shared(self):
+        """Test that serializers nesting a cached serializer each get their own copy."""
+        stock = Stock.objects.with_latest_run().get(pk=self.stock.pk)
+        
+        first = StockLatestRunSerializer(stock)
+        second = StockLatestRunSerializer(stock)
+        
+        self.assertIsNot(first.fields['stock'], second.fields['stock'])
+        self.assertEqual(first.data['stock']['ticker'], 'AAPL')
+        self.assertEqual(second.data['stock']['name'], 'Apple Inc.')
+
+    def test_request_validation_independent_across_instances(self):
+        """Test that request serializers sharing cached fields validate each payload on its own."""
+        invalid = QueueForFetchRequestSerializer(data={'ticker': 'BRK.B'})
+        valid = QueueForFetchRequestSerializer(data={'ticker': ' msft ', 'requested_by': 'svc'})
+        
+        self.assertFalse(invalid.is_valid())
+        self.assertTrue(valid.is_valid())
+        self.assertIn('ticker', invalid.errors)
+        self.assertEqual(valid.validated_data, {'ticker': 'MSFT', 'requested_by': 'svc'})
+        self.assertFalse(QueueForFetchRequestSerializer(data={}).is_valid())
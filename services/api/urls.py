@@ -6,6 +6,7 @@ status tracking endpoints.
 
 Endpoints:
     GET  /tickers                                   - List all stocks
+    GET  /tickers/latest-runs                       - List all stocks with their latest run
     GET  /ticker/<ticker>/detail                    - Get stock details
     GET  /ticker/<ticker>/status                    - Get current status of a stock
     POST /ticker/queue                              - Queue a stock for ingestion
@@ -13,6 +14,7 @@ Endpoints:
     GET  /exchanges                                 - List all exchanges
     GET  /sectors                                   - List all sectors
     GET  /runs                                      - List all ingestion runs
+    GET  /runs/summary                              - List all ingestion runs (summary fields)
     GET  /runs/ticker/<ticker>                      - List runs for a specific ticker
     GET  /run/<run_id>/detail                       - Get details of a specific run
     GET  /bulk-queue-runs                           - List all bulk queue runs
@@ -30,10 +32,12 @@ from api.views import (
     QueueForFetchView,
     RunDetailView,
     RunListView,
+    RunSummaryListView,
     SectorListView,
     StockDataView,
     StockStatusView,
     TickerDetailView,
+    TickerLatestRunListView,
     TickerListView,
     TickerRunsListView,
 )
@@ -48,6 +52,11 @@ urlpatterns = [
         TickerListView.as_view(),
         name='ticker-list'
     ),
+    path(
+        'tickers/latest-runs',
+        TickerLatestRunListView.as_view(),
+        name='ticker-latest-run-list'
+    ),
     path(
         'ticker/<str:ticker>/detail',
         TickerDetailView.as_view(),
@@ -94,6 +103,11 @@ urlpatterns = [
         RunListView.as_view(),
         name='run-list'
     ),
+    path(
+        'runs/summary',
+        RunSummaryListView.as_view(),
+        name='run-summary-list'
+    ),
     path(
         'run/<str:run_id>/detail',
         RunDetailView.as_view(),
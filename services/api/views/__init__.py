@@ -17,9 +17,11 @@ Views:
     - RunDetailView
     - QueueForFetchView
     - TickerListView
+    - TickerLatestRunListView
     - ExchangeListView
     - SectorListView
     - RunListView
+    - RunSummaryListView
     - BulkQueueRunListView
     - TickerRunsListView
     - TickerDetailView
@@ -29,7 +31,7 @@ Views:
 
 from .bulk_queue_runs import BulkQueueRunStatsDetailView, QueueAllStocksForFetchView
 from .ingestion_runs import QueueForFetchView, RunDetailView
-from .list_views import ExchangeListView, SectorListView, TickerListView, RunListView, BulkQueueRunListView, TickerRunsListView
+from .list_views import ExchangeListView, SectorListView, TickerListView, TickerLatestRunListView, RunListView, RunSummaryListView, BulkQueueRunListView, TickerRunsListView
 from .stocks import TickerDetailView, StockStatusView, StockDataView
 __all__ = [
     'BulkQueueRunStatsDetailView',
@@ -37,9 +39,11 @@ __all__ = [
     'RunDetailView',
     'QueueForFetchView',
     'TickerListView',
+    'TickerLatestRunListView',
     'ExchangeListView',
     'SectorListView',
     'RunListView',
+    'RunSummaryListView',
     'BulkQueueRunListView',
     'TickerRunsListView',
     'TickerDetailView',
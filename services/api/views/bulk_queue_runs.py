@@ -116,9 +116,9 @@ class BulkQueueRunStatsDetailView(APIView):
         
         try:
             # Fetch BulkQueueRun
-            # Note: We don't use prefetch_related here because the serializer
-            # performs database aggregation which is more efficient than loading
-            # all objects into memory
+            # Note: We don't use prefetch_related here because the ingestion
+            # runs are counted by a database aggregation, which is more
+            # efficient than loading all objects into memory
             bulk_queue_run = BulkQueueRun.objects.get(id=bulk_queue_run_uuid)
         except BulkQueueRun.DoesNotExist:
             logger.warning(
@@ -136,8 +136,12 @@ class BulkQueueRunStatsDetailView(APIView):
                 status=status.HTTP_404_NOT_FOUND
             )
         
-        # Serialize the data (this triggers the aggregation in the serializer)
-        serializer = BulkQueueRunStatsSerializer(bulk_queue_run)
+        # Count the ingestion runs by state in one GROUP BY query
+        ingestion_run_stats = BulkQueueRun.objects.get_ingestion_run_stats([bulk_queue_run.id])
+        serializer = BulkQueueRunStatsSerializer(
+            bulk_queue_run,
+            context={'ingestion_run_stats': ingestion_run_stats}
+        )
         serialized_data = serializer.data
         
         # Store in cache with 5-minute TTL
@@ -3,7 +3,9 @@ API List Views for Stock Ticker ETL Pipeline.
 
 This module contains the API views for:
 - GET /tickers - List all stocks
+- GET /tickers/latest-runs - List all stocks with their latest ingestion run
 - GET /runs - List all ingestion runs
+- GET /runs/summary - List all ingestion runs, summary fields only
 - GET /bulk-queue-runs - List all bulk queue runs
 - GET /exchanges - List all exchanges
 - GET /sectors - List all sectors
@@ -12,21 +14,30 @@ This module contains the API views for:
 
 import logging
 
+from django.db.models import F
 from django.utils.decorators import method_decorator
-from django.views.decorators.cache import cache_page
-from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import status
 from rest_framework.generics import ListAPIView
 from rest_framework.request import Request
 from rest_framework.response import Response
 
-from api.filters import BulkQueueRunFilter, ExchangeFilter, SectorFilter, StockFilter, StockIngestionRunFilter
+from api.cache_utils import cache_list_view
+from api.filters import (
+    BulkQueueRunFilter,
+    ExchangeFilter,
+    QueryParamFilterBackend,
+    SectorFilter,
+    StockFilter,
+    StockIngestionRunFilter,
+    StockLatestRunFilter,
+)
 from api.models import BulkQueueRun, Exchange, Sector, Stock, StockIngestionRun
 from api.serializers import (
     BulkQueueRunSerializer,
     ExchangeSerializer,
     SectorSerializer,
     StockIngestionRunSerializer,
+    StockLatestRunSerializer,
     StockSerializer,
 )
 from .paginator import StandardCursorPagination
@@ -35,7 +46,7 @@ from .paginator import StandardCursorPagination
 logger = logging.getLogger(__name__)
 
 
-@method_decorator(cache_page(None, key_prefix='api:exchange-list'), name='dispatch')
+@method_decorator(cache_list_view(None, key_prefix='api:exchange-list'), name='dispatch')
 class ExchangeListView(ListAPIView):
     """
     API endpoint for listing all exchanges.
@@ -62,19 +73,19 @@ class ExchangeListView(ListAPIView):
         GET /api/exchanges?name=NYSE&name__icontains=Y
     
     Caching:
-        Responses are cached indefinitely (no expiry) using cache_page decorator.
+        Responses are cached indefinitely (no expiry) using cache_list_view decorator.
         Each paginated page (with different cursor values) is cached separately with
         unique cache keys. Cache is automatically invalidated when Exchange or Stock
         models are created, updated, or deleted via Django signals.
     """
     serializer_class = ExchangeSerializer
     pagination_class = StandardCursorPagination
-    filter_backends = [DjangoFilterBackend]
+    filter_backends = [QueryParamFilterBackend]
     filterset_class = ExchangeFilter
     queryset = Exchange.objects.all().order_by('-created_at')
 
 
-@method_decorator(cache_page(None, key_prefix='api:sector-list'), name='dispatch')
+@method_decorator(cache_list_view(None, key_prefix='api:sector-list'), name='dispatch')
 class SectorListView(ListAPIView):
     """
     API endpoint for listing all sectors.
@@ -101,19 +112,19 @@ class SectorListView(ListAPIView):
         GET /api/sectors?name=Financials&name__icontains=Fin
     
     Caching:
-        Responses are cached indefinitely (no expiry) using cache_page decorator.
+        Responses are cached indefinitely (no expiry) using cache_list_view decorator.
         Each paginated page (with different cursor values) is cached separately with
         unique cache keys. Cache is automatically invalidated when Sector or Stock
         models are created, updated, or deleted via Django signals.
     """
     serializer_class = SectorSerializer
     pagination_class = StandardCursorPagination
-    filter_backends = [DjangoFilterBackend]
+    filter_backends = [QueryParamFilterBackend]
     filterset_class = SectorFilter
     queryset = Sector.objects.all().order_by('-created_at')
 
 
-@method_decorator(cache_page(None, key_prefix='api:ticker-list'), name='dispatch')
+@method_decorator(cache_list_view(None, key_prefix='api:ticker-list'), name='dispatch')
 class TickerListView(ListAPIView):
     """
     API endpoint for listing all stocks.
@@ -124,7 +135,7 @@ class TickerListView(ListAPIView):
     Supports filtering by ticker, sector, exchange, and country.
     
     Caching:
-        Responses are cached indefinitely (no expiry) using cache_page decorator.
+        Responses are cached indefinitely (no expiry) using cache_list_view decorator.
         Each paginated page (with different cursor values) is cached separately with
         unique cache keys. Cache is automatically invalidated when Exchange or Stock
         models are created, updated, or deleted via Django signals.
@@ -132,7 +143,7 @@ class TickerListView(ListAPIView):
     """
     serializer_class = StockSerializer
     pagination_class = StandardCursorPagination
-    filter_backends = [DjangoFilterBackend]
+    filter_backends = [QueryParamFilterBackend]
     filterset_class = StockFilter
     queryset = (
         Stock.objects
@@ -141,6 +152,33 @@ class TickerListView(ListAPIView):
     )
 
 
+class TickerLatestRunListView(ListAPIView):
+    """
+    API endpoint for listing all stocks with their latest ingestion run.
+    
+    GET /tickers/latest-runs
+    
+    Returns a paginated list of {stock, latest_run} items with cursor-based
+    pagination, for dashboards showing each stock's current pipeline state.
+    Each page is a single query: the latest run of every stock is selected and
+    built as a JSON object by the database (see Stock.objects.with_latest_run()).
+    Supports the same filters as GET /tickers, plus latest_run_state and
+    latest_run_state__in (e.g. ?latest_run_state=FAILED).
+    
+    Not cached: run states change on every pipeline step.
+    """
+    serializer_class = StockLatestRunSerializer
+    pagination_class = StandardCursorPagination
+    filter_backends = [QueryParamFilterBackend]
+    filterset_class = StockLatestRunFilter
+    queryset = (
+        Stock.objects
+        .with_latest_run()
+        .select_related('exchange', 'sector')
+        .order_by('-created_at')
+    )
+
+
 class RunListView(ListAPIView):
     """
     API endpoint for listing all ingestion runs.
@@ -152,9 +190,55 @@ class RunListView(ListAPIView):
     """
     serializer_class = StockIngestionRunSerializer
     pagination_class = StandardCursorPagination
-    filter_backends = [DjangoFilterBackend]
+    filter_backends = [QueryParamFilterBackend]
+    filterset_class = StockIngestionRunFilter
+    queryset = StockIngestionRunSerializer.setup_eager_loading(
+        StockIngestionRun.objects.order_by('-created_at')
+    )
+
+
+class RunSummaryListView(ListAPIView):
+    """
+    API endpoint for listing all ingestion runs with summary fields only.
+    
+    GET /runs/summary
+    
+    Returns the same paginated, filterable list as GET /runs, but each run only
+    has its id, stock_id, ticker, state, is_terminal, created_at and updated_at.
+    Rows are read with values() and rendered as is, without a serializer, so
+    large pages of runs (e.g. dashboards polling ?is_in_progress=true) cost no
+    per-field serialization.
+    """
+    pagination_class = StandardCursorPagination
+    filter_backends = [QueryParamFilterBackend]
     filterset_class = StockIngestionRunFilter
-    queryset = StockIngestionRun.objects.select_related('stock').all().order_by('-created_at')
+    queryset = (
+        StockIngestionRun.objects
+        .order_by('-created_at')
+        .values(
+            'id',
+            'stock_id',
+            'state',
+            'created_at',
+            'updated_at',
+            ticker=F('stock__ticker'),
+            is_terminal=F('terminal'),
+        )
+    )
+
+    def list(self, request: Request, *args, **kwargs) -> Response:
+        """
+        List runs as the dicts returned by the queryset.
+        
+        Args:
+            request: DRF Request object
+            
+        Returns:
+            Paginated response of run summaries
+        """
+        queryset = self.filter_queryset(self.get_queryset())
+        page = self.paginate_queryset(queryset)
+        return self.get_paginated_response(page)
 
 
 class BulkQueueRunListView(ListAPIView):
@@ -188,7 +272,7 @@ class BulkQueueRunListView(ListAPIView):
     """
     serializer_class = BulkQueueRunSerializer
     pagination_class = StandardCursorPagination
-    filter_backends = [DjangoFilterBackend]
+    filter_backends = [QueryParamFilterBackend]
     filterset_class = BulkQueueRunFilter
     queryset = BulkQueueRun.objects.all().order_by('-created_at')
 
@@ -204,15 +288,14 @@ class TickerRunsListView(ListAPIView):
     """
     serializer_class = StockIngestionRunSerializer
     pagination_class = StandardCursorPagination
-    filter_backends = [DjangoFilterBackend]
+    filter_backends = [QueryParamFilterBackend]
     filterset_class = StockIngestionRunFilter
 
     def get_queryset(self):
         """Get runs filtered by ticker from URL parameter."""
         ticker = self.kwargs['ticker'].upper()
-        return (
+        return StockIngestionRunSerializer.setup_eager_loading(
             StockIngestionRun.objects
-            .select_related('stock')
             .filter(stock__ticker=ticker)
             .order_by('-created_at')
         )
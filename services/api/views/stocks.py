@@ -56,7 +56,7 @@ class TickerDetailView(APIView):
             Response with stock details or 404 if not found
         """
         try:
-            stock = Stock.objects.get(ticker=ticker.upper())
+            stock = Stock.objects.select_related('exchange', 'sector').get(ticker=ticker.upper())
             serializer = StockSerializer(stock)
             logger.debug(
                 "Stock details retrieved successfully",
@@ -324,6 +324,13 @@ AUTH_PASSWORD_VALIDATORS = [
     },
 ]
 
+if APP_ENV == "test":
+    # Tests create users with passwords in setUp(); the default PBKDF2 hasher
+    # takes most of each test's run time
+    PASSWORD_HASHERS = [
+        "django.contrib.auth.hashers.MD5PasswordHasher",
+    ]
+
 # Session settings
 SESSION_COOKIE_AGE = 43200  # 12 hours (in seconds)
 SESSION_SAVE_EVERY_REQUEST = True  # Extend session on activity
@@ -6,36 +6,39 @@ the following steps:
 1. Retrieves the BulkQueueRun instance to track statistics
 2. Updates BulkQueueRun.started_at when processing begins
 3. Queries all stocks from the database
-4. For each stock:
-   a. Calls StockIngestionService.queue_for_fetch() to create/get a run
-   b. Links the run to the BulkQueueRun via foreign key
-   c. Increments queued_count if new run created
-   d. Increments skipped_count if run already exists
-   e. Increments error_count if an error occurs
-   f. Queues fetch_stock_data task for new runs
+4. For each batch of stocks:
+   a. Links the active runs of the stocks to the BulkQueueRun if not linked
+      to any yet, in a single UPDATE
+   b. Creates QUEUED_FOR_FETCH runs, linked to the BulkQueueRun, in a single
+      INSERT ... SELECT that skips the stocks with an active run
+      (if the batch fails, steps a and b are retried stock by stock so only
+      the failing stocks are counted as errors)
+   c. Queues fetch_stock_data task for each new run
+   d. Adds the batch's queued, skipped and error counts to the BulkQueueRun
+      in a single UPDATE
 5. Updates BulkQueueRun.completed_at when processing finishes
-6. Logs progress at appropriate intervals
+6. Logs progress after each batch
 """
 
 import logging
 import uuid
 from typing import TypedDict
-from django.db.models import F
+from django.db import transaction
 from django.utils import timezone
 
 from celery import shared_task
 
 from api.models import BulkQueueRun, Exchange, Stock, StockIngestionRun
-from api.services.stock_ingestion_service import StockIngestionService
 from workers.exceptions import NonRetryableError
 from workers.tasks.base import BaseTask
 
 logger = logging.getLogger(__name__)
 
-# Batch size for bulk_update operations
-# This balances memory usage against database roundtrips.
-# With 1000 stocks, this would result in ~10 bulk_update calls instead of 1000 individual saves.
-BULK_UPDATE_BATCH_SIZE = 100
+# Number of stocks queued per batch
+# This balances memory usage and transaction length against database roundtrips.
+# Each batch costs a constant number of queries (active run UPDATE, bulk INSERT,
+# counter UPDATE), so 20k stocks take ~20 batches instead of 20k service calls.
+BULK_QUEUE_BATCH_SIZE = 1000
 
 
 class QueueAllStocksForFetchResult(TypedDict):
@@ -161,8 +164,8 @@ def queue_all_stocks_for_fetch(
                 success=False
             )
     
-    stock_tickers = list(stocks_queryset.values_list('ticker', flat=True).order_by('ticker'))
-    total_stocks = len(stock_tickers)
+    stocks = list(stocks_queryset.only('id', 'ticker').order_by('ticker'))
+    total_stocks = len(stocks)
     
     # Update total_stocks count in BulkQueueRun
     bulk_queue_run.total_stocks = total_stocks
@@ -177,148 +180,94 @@ def queue_all_stocks_for_fetch(
         }
     )
     
-    # Initialize service for queueing stocks
-    service = StockIngestionService()
-    
     # Import fetch_stock_data task here to avoid circular imports
     from workers.tasks.queue_for_fetch import fetch_stock_data
     
-    # Initialize batch list for bulk_update operations
-    bulk_queue_run_updates_batch = []
+    request_id = f"bulk-queue-{bulk_queue_run_id}"
+    total_queued = total_skipped = total_errors = 0
     
-    def flush_bulk_queue_run_updates():
-        """Flush pending bulk_queue_run updates using bulk_update."""
-        nonlocal bulk_queue_run_updates_batch
-        if bulk_queue_run_updates_batch:
-            try:
-                StockIngestionRun.objects.bulk_update(
-                    bulk_queue_run_updates_batch,
-                    fields=['bulk_queue_run'],
-                    batch_size=BULK_UPDATE_BATCH_SIZE
-                )
-                logger.debug(
-                    "Flushed bulk_queue_run updates",
-                    extra={
-                        "bulk_queue_run_id": bulk_queue_run_id,
-                        "batch_size": len(bulk_queue_run_updates_batch)
-                    }
-                )
-            except Exception:
-                # Log the error but don't fail the entire operation
-                logger.exception(
-                    "Failed to flush bulk_queue_run updates",
-                    extra={
-                        "bulk_queue_run_id": bulk_queue_run_id,
-                        "batch_size": len(bulk_queue_run_updates_batch),
-                    }
-                )
-            finally:
-                # Clear the batch regardless of success/failure to avoid reprocessing
-                bulk_queue_run_updates_batch = []
-    
-    # Step 4: Process each stock
-    for index, ticker in enumerate(stock_tickers, start=1):
+    # Step 4: Process stocks in batches
+    for batch_start in range(0, total_stocks, BULK_QUEUE_BATCH_SIZE):
+        batch = stocks[batch_start:batch_start + BULK_QUEUE_BATCH_SIZE]
+        queued_count = error_count = 0
+        
+        # Steps 4a and 4b: Link the active runs and create the missing ones
         try:
-            # Step 4a: Call StockIngestionService.queue_for_fetch()
-            run, created = service.queue_for_fetch(
-                ticker=ticker,
-                requested_by=bulk_queue_run.requested_by,
-                request_id=f"bulk-queue-{bulk_queue_run_id}"
+            new_runs = _create_runs_for_stocks(batch, bulk_queue_run, request_id)
+        except Exception:
+            # Retry stock by stock so one failing stock doesn't fail the batch
+            logger.warning(
+                "Error processing stock batch in bulk queue, retrying stock by stock",
+                extra={
+                    "first_ticker": batch[0].ticker,
+                    "last_ticker": batch[-1].ticker,
+                    "batch_size": len(batch),
+                    "bulk_queue_run_id": bulk_queue_run_id
+                },
+                exc_info=True
             )
-            
-            # Step 4b: Link the run to the BulkQueueRun (batched for efficiency)
-            # Only link if not already assigned to any BulkQueueRun
-            if run.bulk_queue_run_id is None:
-                run.bulk_queue_run = bulk_queue_run
-                bulk_queue_run_updates_batch.append(run)
-                
-                # Flush batch if it reaches the batch size
-                if len(bulk_queue_run_updates_batch) >= BULK_UPDATE_BATCH_SIZE:
-                    flush_bulk_queue_run_updates()
-            
-            # Step 4c & 4d: Update counters and queue task if new run created
-            if created:
-                # Atomically increment queued_count in database
-                BulkQueueRun.objects.filter(id=bulk_queue_run.id).update(
-                    queued_count=F('queued_count') + 1
-                )
-                
-                # Queue the fetch_stock_data task
+            new_runs = []
+            for stock in batch:
                 try:
-                    fetch_stock_data.delay(run_id=str(run.id), ticker=ticker)
-                    logger.debug(
-                        "Queued stock for fetch",
+                    new_runs.extend(_create_runs_for_stocks([stock], bulk_queue_run, request_id))
+                except Exception as e:
+                    error_count += 1
+                    logger.error(
+                        "Error processing stock in bulk queue",
                         extra={
-                            "ticker": ticker,
-                            "run_id": str(run.id),
+                            "ticker": stock.ticker,
+                            "error": str(e),
+                            "error_type": type(e).__name__,
                             "bulk_queue_run_id": bulk_queue_run_id
-                        }
+                        },
+                        exc_info=True
                     )
-                except Exception:
-                    # If we fail to queue the task, atomically decrement queued_count and increment error_count
-                    logger.exception(
-                        "Failed to queue fetch_stock_data task",
-                        extra={
-                            "ticker": ticker,
-                            "run_id": str(run.id),
-                            "bulk_queue_run_id": bulk_queue_run_id
-                        }
-                    )
-                    BulkQueueRun.objects.filter(id=bulk_queue_run.id).update(
-                        queued_count=F('queued_count') - 1,
-                        error_count=F('error_count') + 1
-                    )
-            else:
-                # Atomically increment skipped_count in database
-                BulkQueueRun.objects.filter(id=bulk_queue_run.id).update(
-                    skipped_count=F('skipped_count') + 1
-                )
+        
+        # Stocks with an active run were skipped by the INSERT
+        skipped_count = len(batch) - len(new_runs) - error_count
+        
+        # Step 4c: Queue the fetch_stock_data task for each new run
+        for run in new_runs:
+            try:
+                fetch_stock_data.delay(run_id=str(run.id), ticker=run.stock.ticker)
+                queued_count += 1
                 logger.debug(
-                    "Skipped stock (active run exists)",
+                    "Queued stock for fetch",
                     extra={
-                        "ticker": ticker,
+                        "ticker": run.stock.ticker,
+                        "run_id": str(run.id),
+                        "bulk_queue_run_id": bulk_queue_run_id
+                    }
+                )
+            except Exception:
+                error_count += 1
+                logger.exception(
+                    "Failed to queue fetch_stock_data task",
+                    extra={
+                        "ticker": run.stock.ticker,
                         "run_id": str(run.id),
-                        "state": run.state,
                         "bulk_queue_run_id": bulk_queue_run_id
                     }
                 )
-        
-        except Exception as e:
-            # Step 4e: Handle errors for individual stocks
-            # Atomically increment error_count in database
-            BulkQueueRun.objects.filter(id=bulk_queue_run.id).update(
-                error_count=F('error_count') + 1
-            )
-            logger.error(
-                "Error processing stock in bulk queue",
-                extra={
-                    "ticker": ticker,
-                    "error": str(e),
-                    "error_type": type(e).__name__,
-                    "bulk_queue_run_id": bulk_queue_run_id
-                },
-                exc_info=True
-            )
-            # Continue processing other stocks
-        
-        # Step 5: Log progress at appropriate intervals (every 100 stocks)
-        if index % 100 == 0:
-            # Refresh from database to get current counter values for logging
-            bulk_queue_run.refresh_from_db()
-            logger.info(
-                "Bulk queue progress",
-                extra={
-                    "bulk_queue_run_id": bulk_queue_run_id,
-                    "processed": index,
-                    "total_stocks": total_stocks,
-                    "queued": bulk_queue_run.queued_count,
-                    "skipped": bulk_queue_run.skipped_count,
-                    "errors": bulk_queue_run.error_count
-                }
-            )
     
-    # Flush any remaining bulk_queue_run updates
-    flush_bulk_queue_run_updates()
+        # Step 4d: Atomically add the batch's counts in the database
+        bulk_queue_run.increment(queued=queued_count, skipped=skipped_count, errors=error_count)
+        total_queued += queued_count
+        total_skipped += skipped_count
+        total_errors += error_count
+        
+        # Step 5: Log progress after each batch
+        logger.info(
+            "Bulk queue progress",
+            extra={
+                "bulk_queue_run_id": bulk_queue_run_id,
+                "processed": batch_start + len(batch),
+                "total_stocks": total_stocks,
+                "queued": total_queued,
+                "skipped": total_skipped,
+                "errors": total_errors
+            }
+        )
     
     # Step 6: Update completed_at and read final statistics from database
     bulk_queue_run.completed_at = timezone.now()
@@ -350,3 +299,34 @@ def queue_all_stocks_for_fetch(
         success=True
     )
 
+
+def _create_runs_for_stocks(
+    stocks: list[Stock],
+    bulk_queue_run: BulkQueueRun,
+    request_id: str,
+) -> list[StockIngestionRun]:
+    """
+    Link the stocks' active runs to the BulkQueueRun and queue the others.
+    
+    Runs in a single transaction, so on error none of the stocks are linked
+    or queued.
+    
+    Returns:
+        The runs created (stocks with an active run are skipped)
+    """
+    with transaction.atomic():
+        # Link existing active runs to the BulkQueueRun if not already
+        # assigned to any BulkQueueRun
+        (
+            StockIngestionRun.objects.get_active_runs()
+            .filter(stock__in=stocks, bulk_queue_run__isnull=True)
+            .update(bulk_queue_run=bulk_queue_run)
+        )
+        
+        # Create runs for the stocks without an active run
+        return StockIngestionRun.objects.bulk_create_queued(
+            stocks,
+            bulk_queue_run=bulk_queue_run,
+            requested_by=bulk_queue_run.requested_by,
+            request_id=request_id,
+        )
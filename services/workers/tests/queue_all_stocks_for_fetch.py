@@ -12,7 +12,9 @@ This module contains comprehensive tests for:
 import uuid
 from unittest.mock import patch, call
 
+from django.db import connection
 from django.test import TransactionTestCase
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 
 from api.models import BulkQueueRun, Exchange, IngestionState, Stock, StockIngestionRun
@@ -139,40 +141,79 @@ class QueueAllStocksForFetchTaskTest(TransactionTestCase):
         self.assertEqual(new_runs.count(), 2)
     
     def test_error_handling_for_individual_stock_failures(self, mock_fetch_delay):
-        """Test that individual stock failures are handled gracefully."""
-        # Mock queue_for_fetch to raise an exception for GOOGL
-        with patch('workers.tasks.queue_all_stocks_for_fetch.StockIngestionService') as mock_service:
-            service_instance = mock_service.return_value
-            
-            def queue_for_fetch_side_effect(ticker, **kwargs):
-                if ticker == 'GOOGL':
-                    raise Exception("Database error for GOOGL")
-                
-                # Create a real run for other stocks
-                stock = Stock.objects.get(ticker=ticker)
-                run = StockIngestionRun.objects.create(
-                    stock=stock,
-                    state=IngestionState.QUEUED_FOR_FETCH,
-                    requested_by=kwargs.get('requested_by'),
-                    request_id=kwargs.get('request_id')
-                )
-                return run, True
-            
-            service_instance.queue_for_fetch.side_effect = queue_for_fetch_side_effect
-            
-            # Execute task
+        """Test that a failing batch is retried stock by stock, so only the failing stock is an error."""
+        bulk_create_queued = StockIngestionRun.objects.bulk_create_queued
+        
+        def bulk_create_queued_side_effect(stocks, **kwargs):
+            if any(stock.ticker == 'GOOGL' for stock in stocks):
+                raise Exception("Database error for GOOGL")
+            return bulk_create_queued(stocks, **kwargs)
+        
+        # Two stocks per batch: (AAPL, GOOGL) fails and is retried per stock, (MSFT) is queued
+        with patch('workers.tasks.queue_all_stocks_for_fetch.BULK_QUEUE_BATCH_SIZE', 2), \
+                patch.object(
+                    StockIngestionRun.objects, 'bulk_create_queued',
+                    side_effect=bulk_create_queued_side_effect
+                ):
             result = queue_all_stocks_for_fetch(str(self.bulk_queue_run.id))
-            
-            # Verify result - should have 1 error, 2 queued
-            self.assertEqual(result['total_stocks'], 3)
-            self.assertEqual(result['queued_count'], 2)
-            self.assertEqual(result['skipped_count'], 0)
-            self.assertEqual(result['error_count'], 1)
-            self.assertTrue(result['success'])  # Task completes even with individual failures
-            
-            # Verify BulkQueueRun statistics
-            self.bulk_queue_run.refresh_from_db()
-            self.assertEqual(self.bulk_queue_run.error_count, 1)
+        
+        # Verify result - should have 1 error, 2 queued
+        self.assertEqual(result['total_stocks'], 3)
+        self.assertEqual(result['queued_count'], 2)
+        self.assertEqual(result['skipped_count'], 0)
+        self.assertEqual(result['error_count'], 1)
+        self.assertTrue(result['success'])  # Task completes even with individual failures
+        
+        # Verify BulkQueueRun statistics
+        self.bulk_queue_run.refresh_from_db()
+        self.assertEqual(self.bulk_queue_run.error_count, 1)
+        
+        # Verify every stock but GOOGL got a run
+        runs = StockIngestionRun.objects.filter(bulk_queue_run=self.bulk_queue_run)
+        self.assertEqual(sorted(run.stock.ticker for run in runs), ['AAPL', 'MSFT'])
+        self.assertEqual(mock_fetch_delay.call_count, 2)
+    
+    def test_batch_retry_counts_skipped_stocks(self, mock_fetch_delay):
+        """Test that stocks with an active run are still counted as skipped when a batch is retried."""
+        StockIngestionRun.objects.create(stock=self.stock1, state=IngestionState.FETCHING)
+        bulk_create_queued = StockIngestionRun.objects.bulk_create_queued
+        
+        def bulk_create_queued_side_effect(stocks, **kwargs):
+            if len(stocks) > 1:
+                raise Exception("Database error for batch")
+            return bulk_create_queued(stocks, **kwargs)
+        
+        with patch.object(
+            StockIngestionRun.objects, 'bulk_create_queued',
+            side_effect=bulk_create_queued_side_effect
+        ):
+            result = queue_all_stocks_for_fetch(str(self.bulk_queue_run.id))
+        
+        self.assertEqual(result['queued_count'], 2)
+        self.assertEqual(result['skipped_count'], 1)
+        self.assertEqual(result['error_count'], 0)
+    
+    def test_stocks_processed_in_batches(self, mock_fetch_delay):
+        """Test that each batch is queued with a constant number of queries."""
+        for i in range(7):
+            Stock.objects.create(ticker=f'STOCK{i:04d}')
+        StockIngestionRun.objects.create(stock=self.stock1, state=IngestionState.FETCHING)
+        
+        with patch('workers.tasks.queue_all_stocks_for_fetch.BULK_QUEUE_BATCH_SIZE', 5):
+            with CaptureQueriesContext(connection) as queries:
+                result = queue_all_stocks_for_fetch(str(self.bulk_queue_run.id))
+        
+        self.assertEqual(result['total_stocks'], 10)
+        self.assertEqual(result['queued_count'], 9)
+        self.assertEqual(result['skipped_count'], 1)
+        
+        # One INSERT ... SELECT of runs per batch of 5 stocks
+        run_inserts = [
+            query['sql'] for query in queries
+            if 'INSERT INTO stock_ingestion_runs' in query['sql']
+        ]
+        self.assertEqual(len(run_inserts), 2)
+        self.assertEqual(StockIngestionRun.objects.filter(bulk_queue_run=self.bulk_queue_run).count(), 10)
     
     def test_ingestion_runs_properly_linked_to_bulk_queue_run(self, mock_fetch_delay):
         """Test that StockIngestionRun instances are properly linked to BulkQueueRun."""